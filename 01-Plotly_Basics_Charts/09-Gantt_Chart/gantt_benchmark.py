@@ -0,0 +1,149 @@
+# %%
+"""
+Benchmark: Gantt Charts from 1k to 1M Tasks
+===========================================
+
+Generates deterministic synthetic project schedules (tasks, resources,
+dependencies, progress and milestones) and measures, for each size:
+- px.timeline with one trace per resource
+- gantt_figure from gantt_engine.py (one bar trace), with and without lane
+  packing, and with progress, milestone and "today" overlays
+- the TimelinePyramid overview (occupancy bands), build included
+
+and reports build time, figure JSON size and peak Python memory
+(tracemalloc). Plotly Express is only timed up to PX_MAX_TASKS tasks.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from gantt_engine import TimelinePyramid, add_marker_lines, gantt_figure, milestone_trace
+from gantt_scheduling import critical_path_arrays
+
+# Shared helpers live in 01-Plotly_Basics_Charts/plotly_perf
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from plotly_perf.benchmark import measure
+
+PX_MAX_TASKS = 100_000
+DAY_MS = 86_400_000
+
+
+def synthetic_schedule(n_tasks, n_resources=50, project_size=200, seed=42):
+    """Random but reproducible schedule of ``n_tasks`` tasks.
+
+    Tasks come in projects of ``project_size`` consecutive tasks, each
+    starting somewhere in 2020-2024. Within a project a task waits on up to
+    two of the 20 tasks before it, and start dates follow from those
+    dependencies (earliest start, see gantt_scheduling.py). Progress is
+    measured against a status date in mid 2022.
+
+    Returns ``(tasks, dependencies, milestones)`` DataFrames; milestones mark
+    the end of every project, on the resource of its last task.
+    """
+    rng = np.random.default_rng(seed)
+    positions = np.arange(n_tasks)
+    project = positions // project_size
+    duration = np.ceil(rng.gamma(2.0, 2.5, n_tasks))
+
+    successors = np.repeat(positions, 2)
+    predecessors = successors - rng.integers(1, 21, len(successors))
+    keep = (predecessors >= 0) & (rng.random(len(successors)) < 0.7)
+    keep[keep] = project[predecessors[keep]] == project[successors[keep]]
+    predecessors, successors = predecessors[keep], successors[keep]
+    schedule = critical_path_arrays(duration, predecessors, successors)
+
+    project_start = np.datetime64("2020-01-01", "ms").astype(np.int64) + rng.integers(0, 5 * 365, project.max() + 1) * DAY_MS
+    start = project_start[project] + schedule["earliest_start"].astype(np.int64) * DAY_MS
+    finish = start + duration.astype(np.int64) * DAY_MS
+    status_ms = np.datetime64("2022-07-01", "ms").astype(np.int64)
+
+    names = "Task " + pd.RangeIndex(n_tasks).astype(str)
+    tasks = pd.DataFrame(
+        {
+            "Task": names,
+            "Project": "Project " + pd.Series(project).astype(str),
+            "Resource": "Resource " + pd.Series(rng.integers(0, n_resources, n_tasks)).astype(str).str.zfill(3),
+            "Start": start.astype("datetime64[ms]"),
+            "Finish": finish.astype("datetime64[ms]"),
+            "Duration": duration,
+            "Progress": np.clip((status_ms - start) / (finish - start), 0, 1),
+            "Critical": np.isclose(schedule["slack"], 0),
+        }
+    )
+    dependencies = pd.DataFrame({"Predecessor": names[predecessors], "Successor": names[successors]})
+    last = tasks.loc[tasks.groupby("Project", sort=False)["Finish"].idxmax()]
+    milestones = pd.DataFrame(
+        {"Project": last["Project"], "Resource": last["Resource"], "Date": last["Finish"], "Label": last["Project"] + " complete"}
+    ).reset_index(drop=True)
+    return tasks, dependencies, milestones
+
+
+def overlay_figure(tasks, milestones):
+    # Packed bars plus progress, milestones and a "today" line: four traces
+    fig = gantt_figure(tasks, "Start", "Finish", "Resource", color="Resource", pack=True, progress="Progress")
+    resource_rows = pd.Series(fig.layout.yaxis.tickvals, index=fig.layout.yaxis.ticktext)
+    rows = resource_rows[milestones["Resource"]].to_numpy()
+    fig.add_trace(milestone_trace(milestones["Date"], rows, labels=milestones["Label"], size=6))
+    return add_marker_lines(fig, ["2022-07-01"], labels=["Today"], color="red")
+
+
+def run(sizes):
+    results = []
+    for n_tasks in sizes:
+        tasks, dependencies, milestones = synthetic_schedule(n_tasks)
+        methods = {
+            "gantt_figure": lambda: gantt_figure(tasks, "Start", "Finish", "Resource", color="Resource"),
+            "gantt_figure packed": lambda: gantt_figure(tasks, "Start", "Finish", "Resource", color="Resource", pack=True),
+            "packed + overlays": lambda: overlay_figure(tasks, milestones),
+            "pyramid overview": lambda: TimelinePyramid(tasks["Start"], tasks["Finish"], tasks["Resource"]).figure(),
+        }
+        if n_tasks <= PX_MAX_TASKS:
+            methods["px.timeline"] = lambda: px.timeline(tasks, x_start="Start", x_end="Finish", y="Resource", color="Resource")
+
+        for method, build in methods.items():
+            seconds, json_bytes, peak = measure(build)
+            results.append(dict(tasks=n_tasks, method=method, seconds=seconds, json_mb=json_bytes / 1e6, peak_mb=peak / 1e6))
+            print(
+                f"tasks={n_tasks:>9,} dependencies={len(dependencies):>9,} {method:<20} "
+                f"{seconds:8.3f}s {json_bytes / 1e6:8.2f} MB JSON {peak / 1e6:8.1f} MB peak"
+            )
+    return pd.DataFrame(results)
+
+
+# %%
+# ==============================================================================
+# THE GENERATOR: a small schedule
+# ==============================================================================
+tasks, dependencies, milestones = synthetic_schedule(1_000, n_resources=10, project_size=100)
+print(tasks.head().to_string(index=False))
+print(f"{len(dependencies):,} dependencies, {len(milestones)} milestones, {tasks['Critical'].mean():.0%} of tasks critical")
+
+# Same seed, same schedule
+assert synthetic_schedule(1_000, n_resources=10, project_size=100)[0].equals(tasks)
+
+# %%
+# ==============================================================================
+# BENCHMARK: 1k to 1M tasks
+# ==============================================================================
+results = run([1_000, 10_000, 100_000, 1_000_000])
+
+fig = px.line(
+    results,
+    x="tasks",
+    y="seconds",
+    color="method",
+    markers=True,
+    log_x=True,
+    log_y=True,
+    title="Gantt figure build time vs tasks",
+)
+fig.show()
+
+print("\nFigure JSON size (MB):")
+print(results.pivot_table(index="tasks", columns="method", values="json_mb").round(2).to_string())
+print("\nPeak traced memory (MB):")
+print(results.pivot_table(index="tasks", columns="method", values="peak_mb").round(1).to_string())
@@ -0,0 +1,90 @@
+# %%
+"""
+Critical Path and Slack
+=======================
+
+The schedules in Gantt_Chart.py come with fixed start and end dates. In a
+real plan you know the durations and which tasks wait on which, and the
+dates follow from those. gantt_scheduling.py works out the earliest and
+latest dates of every task, its slack, and the critical path: the chain
+of zero-slack tasks that sets the project end date.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from gantt_scheduling import critical_path, critical_path_arrays, critical_path_figure
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: a small software project
+# ==============================================================================
+df = pd.DataFrame(
+    {
+        "Task": ["Planning", "Design", "Backend", "Frontend", "Documentation", "Testing", "Deployment"],
+        "Duration": [14, 16, 28, 21, 10, 14, 7],
+        "Depends On": [None, "Planning", "Design", "Design", "Design", "Backend, Frontend", "Testing, Documentation"],
+    }
+)
+
+schedule = critical_path(df, project_start="2023-01-01")
+print(schedule[["Task", "Start", "Finish", "Latest Finish", "Slack", "Critical"]].to_string(index=False))
+
+fig = critical_path_figure(schedule, row_height=40, title="Project Schedule (critical path in red)")
+fig.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 2: 100k tasks with 300k dependencies
+# ==============================================================================
+# Each task waits on up to three earlier tasks, at most 1,000 positions back
+rng = np.random.default_rng(42)
+n_tasks = 100_000
+successors = np.repeat(np.arange(1, n_tasks), 3)
+predecessors = successors - rng.integers(1, 1001, len(successors))
+keep = predecessors >= 0
+predecessors, successors = predecessors[keep], successors[keep]
+durations = rng.gamma(2.0, 2.0, n_tasks)
+
+t0 = time.perf_counter()
+result = critical_path_arrays(durations, predecessors, successors)
+elapsed = time.perf_counter() - t0
+critical = np.isclose(result["slack"], 0)
+print(
+    f"{n_tasks:,} tasks, {len(successors):,} dependencies: scheduled in {elapsed:.2f}s "
+    f"({result['level'].max() + 1:,} topological levels)"
+)
+print(f"Project length: {result['earliest_finish'].max():,.1f} days, {critical.sum():,} critical tasks")
+
+# The same through the DataFrame interface, dependencies as (predecessor, successor) pairs
+names = "Task " + pd.RangeIndex(n_tasks).astype(str)
+tasks = pd.DataFrame({"Task": names, "Duration": durations})
+pairs = pd.DataFrame({"Predecessor": names[predecessors], "Successor": names[successors]})
+t0 = time.perf_counter()
+big_schedule = critical_path(tasks, dependencies=pairs, project_start="2023-01-01")
+print(f"critical_path() on the DataFrame: {time.perf_counter() - t0:.2f}s")
+
+# Dependencies on either side must name known tasks
+for bad in [("Task 0", "Task X"), ("Task X", "Task 0")]:
+    try:
+        critical_path(tasks, dependencies=pd.DataFrame([bad]), project_start="2023-01-01")
+    except ValueError as error:
+        print(f"Rejected {bad}: {error}")
+    else:
+        raise AssertionError(f"{bad} should be rejected")
+
+# Numbered tasks: integer ids, in lists or split from strings, match as numbers
+numbered = pd.DataFrame({"Task": [1, 2, 3], "Duration": [2, 3, 1], "Depends On": [None, [1], "1, 2"]})
+numbered_schedule = critical_path(numbered, project_start="2023-01-01")
+assert numbered_schedule["Start"].tolist() == pd.to_datetime(["2023-01-01", "2023-01-03", "2023-01-06"]).tolist()
+
+# %%
+# ==============================================================================
+# EXAMPLE 3: the first 2,000 tasks of the large schedule, packed into lanes
+# ==============================================================================
+# Critical and non-critical tasks each get their own block of lanes
+head = big_schedule.head(2_000).assign(Status=lambda d: np.where(d["Critical"], "Critical", "Has slack"))
+fig = critical_path_figure(head.assign(Task=head["Status"]), pack=True, title="First 2,000 tasks, packed by status")
+fig.show()
@@ -0,0 +1,663 @@
+"""
+Lane-Packed Timelines for Large Gantt Charts
+============================================
+
+``px.timeline(df, x_start=..., x_end=..., y="Task")`` gives every task its
+own row. With tens of thousands of tasks the figure gets impossibly tall
+and the payload huge.
+
+This module packs tasks into lanes instead:
+- ``pack_lanes`` puts every task into the first free lane of its resource,
+  using interval partitioning (tasks sorted by start, a min-heap of lane end
+  times per resource), which gives the minimal number of lanes
+- ``lane_figure`` draws the packed lanes as one horizontal bar trace, with
+  one tick label per resource
+- ``gantt_figure`` is a ``px.timeline``-style entry point that draws every
+  bar in a single trace, colored through a numeric array and a discrete
+  colorscale instead of one trace per color group
+- ``progress_trace`` overlays each bar's completed part, all tasks in one
+  extra trace
+- ``add_marker_lines`` and ``milestone_trace`` draw any number of vertical
+  markers ("Today", deadlines) or milestone glyphs as one trace each,
+  instead of one layout shape or annotation per marker
+- ``IntervalIndex`` finds the tasks overlapping a time window with two
+  binary searches, so zooming re-renders only the visible tasks
+- ``utilization`` counts running tasks per resource on a time grid with an
+  event sweep, and ``utilization_figure`` stacks it under the timeline
+- ``TimelinePyramid`` precomputes day/week/month occupancy and draws bands
+  when zoomed out, bars when zoomed in
+
+Times are handled as epoch milliseconds (``to_epoch_ms``); Plotly's date
+axes accept those directly, and float64 arrays go out as compact base64.
+"""
+
+import heapq
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Beyond this many y values, tick labels would overlap; rely on hover instead
+MAX_TICKS = 100
+
+# window_from_relayout result for a reset x-axis: no start, no end
+AUTORANGE = (None, None)
+
+
+def to_epoch_ms(values):
+    """Milliseconds since the epoch as float64, from dates, strings or numbers."""
+    if not hasattr(values, "dtype"):
+        values = np.asarray(values)
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return np.asarray(values, dtype=np.float64)
+    return pd.to_datetime(values).to_numpy("datetime64[ms]").astype(np.int64).astype(np.float64)
+
+
+def pack_lanes(start, end, groups=None):
+    """Assign every task to a lane so tasks in a lane never overlap.
+
+    ``start``/``end`` are numeric arrays (e.g. from ``to_epoch_ms``) and
+    ``groups`` optional resource labels; lanes are counted per group. A task
+    may start exactly when the previous one in its lane ends.
+
+    Returns ``(lanes, group_codes, group_labels, lane_counts)``: the lane of
+    every task, its group code, the group labels and the number of lanes
+    each group needs.
+    """
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    if groups is None:
+        codes, labels = np.zeros(len(start), dtype=np.int64), np.array([""], dtype=object)
+    else:
+        codes, labels = pd.factorize(np.asarray(groups), sort=True)
+        labels = np.asarray(labels, dtype=object)
+
+    order = np.lexsort((start, codes))
+    lanes = np.empty(len(start), dtype=np.int64)
+    lane_counts = np.zeros(len(labels), dtype=np.int64)
+
+    # Plain Python lists iterate much faster than NumPy scalars
+    sorted_codes = codes[order].tolist()
+    sorted_starts = start[order].tolist()
+    sorted_ends = end[order].tolist()
+    sorted_lanes = [0] * len(order)
+    heap, n_lanes, current = [], 0, None
+    for i, (code, task_start, task_end) in enumerate(zip(sorted_codes, sorted_starts, sorted_ends)):
+        if code != current:
+            if current is not None:
+                lane_counts[current] = n_lanes
+            heap, n_lanes, current = [], 0, code
+        if heap and heap[0][0] <= task_start:
+            # Reuse the lane that frees up first
+            lane = heap[0][1]
+            heapq.heapreplace(heap, (task_end, lane))
+        else:
+            lane = n_lanes
+            n_lanes += 1
+            heapq.heappush(heap, (task_end, lane))
+        sorted_lanes[i] = lane
+    if current is not None:
+        lane_counts[current] = n_lanes
+
+    lanes[order] = sorted_lanes
+    return lanes, codes, labels, lane_counts
+
+
+def lane_rows(lanes, group_codes, lane_counts, gap=1):
+    """Row position of every task, with ``gap`` empty rows between groups.
+
+    Also returns the center row and the first row of every group.
+    """
+    group_start = np.concatenate([[0], np.cumsum(lane_counts + gap)[:-1]])
+    centers = group_start + (lane_counts - 1) / 2
+    return group_start[group_codes] + lanes, centers, group_start
+
+
+def timeline_figure(
+    start_ms,
+    end_ms,
+    rows,
+    tick_rows,
+    tick_labels,
+    n_rows=None,
+    hovertext=None,
+    color="#636efa",
+    colorscale=None,
+    row_height=12,
+    title=None,
+    **bar_kwargs,
+):
+    """One horizontal bar trace of tasks placed on precomputed ``rows``.
+
+    ``color`` is one color, or a numeric array mapped through ``colorscale``
+    (see ``discrete_colorscale``).
+    """
+    n_rows = n_rows or (int(np.max(rows)) + 1 if len(rows) else 1)
+    marker = dict(color=color, line=dict(width=0))
+    if colorscale is not None:
+        marker.update(colorscale=colorscale, cmin=-0.5, cmax=len(colorscale) / 2 - 0.5, showscale=False)
+    hover = dict(hoverinfo="none")
+    if hovertext is not None:
+        hover = dict(
+            hovertext=hovertext,
+            hovertemplate="<b>%{hovertext}</b><br>%{base|%Y-%m-%d} to %{x|%Y-%m-%d}<extra></extra>",
+        )
+    bar = dict(
+        type="bar",
+        orientation="h",
+        base=start_ms,
+        x=end_ms - start_ms,
+        y=rows,
+        width=0.8,
+        marker=marker,
+        **hover,
+        **bar_kwargs,
+    )
+    layout = dict(
+        title=title,
+        height=max(300, n_rows * row_height + 120),
+        xaxis=dict(type="date"),
+        yaxis=dict(
+            range=[n_rows - 0.5, -0.5],
+            tickvals=tick_rows,
+            ticktext=tick_labels,
+            showgrid=False,
+            zeroline=False,
+        ),
+        bargap=0,
+        # Overlays such as progress_trace sit on top of the task bars
+        barmode="overlay",
+        showlegend=False,
+        margin=dict(l=10, r=10, t=60 if title else 20, b=40),
+    )
+    return go.Figure(data=[bar], layout=layout)
+
+
+def progress_trace(
+    start_ms,
+    end_ms,
+    rows,
+    progress,
+    hovertext=None,
+    color="rgba(0, 0, 0, 0.45)",
+    width=0.35,
+    name="Progress",
+):
+    """Bar trace filling each task from its start to ``progress`` of its length.
+
+    ``progress`` holds fractions (clipped to 0-1). All overlays are one
+    trace laid over the task bars, instead of one shape per task.
+    """
+    start_ms = np.asarray(start_ms, dtype=np.float64)
+    progress = np.clip(np.asarray(progress, dtype=np.float64), 0, 1)
+    template = "%{customdata:.0%} done<extra></extra>"
+    if hovertext is not None:
+        template = "<b>%{hovertext}</b><br>" + template
+    return dict(
+        type="bar",
+        orientation="h",
+        base=start_ms,
+        x=progress * (np.asarray(end_ms, dtype=np.float64) - start_ms),
+        y=rows,
+        width=width,
+        customdata=progress,
+        hovertext=hovertext,
+        hovertemplate=template,
+        marker=dict(color=color, line=dict(width=0)),
+        name=name,
+        showlegend=False,
+    )
+
+
+def marker_lines_trace(x, yaxis, labels=None, color="gray", dash="dash", width=1, name="Markers"):
+    """Any number of full-height vertical lines as one scatter trace.
+
+    Each line is a (bottom, top, gap) triple of points on ``yaxis`` (e.g.
+    "y3"), an overlay axis fixed to 0-1 that the figure doesn't use for
+    anything else; ``add_marker_lines`` picks and sets one up. The lines span
+    the plot like ``add_vline`` without adding a layout shape per line.
+    ``labels`` are written at the top of the lines.
+    """
+    x = to_epoch_ms(x)
+    n = len(x)
+    xs = np.column_stack([x, x, np.full(n, np.nan)]).ravel()
+    ys = np.tile([0.0, 1.0, np.nan], n)
+    text = None
+    if labels is not None:
+        text = np.column_stack([np.full(n, ""), np.asarray(labels, dtype=object), np.full(n, "")]).ravel()
+    return dict(
+        type="scatter",
+        x=xs,
+        y=ys,
+        yaxis=yaxis,
+        mode="lines" if text is None else "lines+text",
+        text=text,
+        textposition="top right",
+        hoverinfo="text+x" if text is not None else "x",
+        line=dict(color=color, dash=dash, width=width),
+        cliponaxis=False,
+        name=name,
+        showlegend=False,
+    )
+
+
+def _marker_axis(fig):
+    # Number of the hidden 0-1 overlay from an earlier call, else of the
+    # first y-axis the figure doesn't use (subplots take yaxis2, yaxis3, ...)
+    layout = fig.layout.to_plotly_json()
+    number = 2
+    while f"yaxis{number}" in layout:
+        axis = layout[f"yaxis{number}"]
+        if axis.get("overlaying") == "y" and axis.get("visible") is False and list(axis.get("range", [])) == [0, 1]:
+            break
+        number += 1
+    return number
+
+
+def add_marker_lines(fig, x, labels=None, **line_kwargs):
+    """Add vertical lines at ``x`` (dates or epoch ms) to ``fig`` in one trace.
+
+    The lines go on a hidden 0-1 axis overlaying ``yaxis``, set up on the
+    first y-axis id the figure doesn't use yet and shared by later calls.
+    """
+    number = _marker_axis(fig)
+    fig.update_layout({f"yaxis{number}": dict(overlaying="y", range=[0, 1], visible=False, fixedrange=True)})
+    return fig.add_trace(marker_lines_trace(x, f"y{number}", labels, **line_kwargs))
+
+
+def milestone_trace(x, y, labels=None, symbol="diamond", size=12, color="black", name="Milestone"):
+    """Milestone glyphs at (``x``, ``y``) as one marker trace."""
+    return dict(
+        type="scatter",
+        x=to_epoch_ms(x),
+        y=np.asarray(y),
+        mode="markers",
+        marker=dict(symbol=symbol, size=size, color=color),
+        hovertext=labels,
+        hovertemplate=("<b>%{hovertext}</b><br>" if labels is not None else "") + "%{x|%Y-%m-%d}<extra></extra>",
+        name=name,
+    )
+
+
+def lane_figure(start, end, groups=None, hovertext=None, color="#636efa", row_height=12, title=None, **bar_kwargs):
+    """Compact timeline: tasks packed into lanes, one bar trace in total.
+
+    ``start``/``end`` are dates, strings or epoch milliseconds. The figure
+    height follows the number of lanes, not the number of tasks.
+    """
+    start_ms, end_ms = to_epoch_ms(start), to_epoch_ms(end)
+    lanes, codes, labels, lane_counts = pack_lanes(start_ms, end_ms, groups)
+    rows, centers, _ = lane_rows(lanes, codes, lane_counts)
+    return timeline_figure(
+        start_ms, end_ms, rows, centers, labels,
+        hovertext=hovertext, color=color, row_height=row_height, title=title, **bar_kwargs,
+    )
+
+
+def discrete_colorscale(colors):
+    """Colorscale giving integer code i the solid color ``colors[i]``."""
+    n = len(colors)
+    scale = []
+    for i, color in enumerate(colors):
+        scale += [(i / n, color), ((i + 1) / n, color)]
+    return scale
+
+
+def category_colors(values, color_discrete_map=None, color_discrete_sequence=None):
+    """Integer codes, categories and one color per category, like px does."""
+    codes, categories = pd.factorize(np.asarray(values))
+    sequence = color_discrete_sequence or px.colors.qualitative.Plotly
+    color_map = color_discrete_map or {}
+    colors = [color_map.get(category, sequence[i % len(sequence)]) for i, category in enumerate(categories)]
+    return codes, np.asarray(categories, dtype=object), colors
+
+
+def gantt_figure(
+    df,
+    x_start,
+    x_end,
+    y,
+    color=None,
+    hover_name=None,
+    color_discrete_map=None,
+    color_discrete_sequence=None,
+    pack=False,
+    max_legend=30,
+    row_height=None,
+    title=None,
+    progress=None,
+    progress_scale=1,
+    **bar_kwargs,
+):
+    """``px.timeline`` replacement that draws all bars in one trace.
+
+    Bars are colored by ``color`` through a numeric code array and a
+    discrete colorscale, so hundreds of categories still make one trace. The
+    legend shows one entry per category (an empty marker trace each) when
+    there are at most ``max_legend`` of them. With ``pack=True`` tasks share
+    lanes per ``y`` value (see ``pack_lanes``) instead of getting a row each.
+    ``progress`` names a column of completed fractions (``progress_scale=100``
+    for percentages), drawn as one overlay trace (see ``progress_trace``).
+    """
+    start_ms, end_ms = to_epoch_ms(df[x_start]), to_epoch_ms(df[x_end])
+    if pack:
+        lanes, codes, labels, lane_counts = pack_lanes(start_ms, end_ms, df[y])
+        rows, tick_rows, _ = lane_rows(lanes, codes, lane_counts)
+    else:
+        rows, labels = pd.factorize(df[y])
+        tick_rows = np.arange(len(labels))
+    if len(labels) > MAX_TICKS and not pack:
+        tick_rows, labels = [], []
+
+    marker = {}
+    categories, colors = [], []
+    if color is not None:
+        codes, categories, colors = category_colors(df[color], color_discrete_map, color_discrete_sequence)
+        marker = dict(color=codes, colorscale=discrete_colorscale(colors))
+
+    hovertext = None if hover_name is None else np.asarray(df[hover_name], dtype=object)
+    fig = timeline_figure(
+        start_ms,
+        end_ms,
+        rows,
+        tick_rows,
+        labels,
+        hovertext=hovertext,
+        # Keep very long schedules to a few thousand pixels
+        row_height=row_height or min(12 if pack else 25, max(1, 3000 / (np.max(rows, initial=0) + 1))),
+        title=title,
+        **marker,
+        **bar_kwargs,
+    )
+    if progress is not None:
+        done = np.asarray(df[progress], dtype=np.float64) / progress_scale
+        fig.add_trace(progress_trace(start_ms, end_ms, rows, done, hovertext=hovertext))
+
+    # Legend: an empty marker trace per category costs no data
+    if 0 < len(categories) <= max_legend:
+        fig.add_traces(
+            [
+                dict(type="scatter", x=[None], y=[None], mode="markers", name=str(category),
+                     marker=dict(symbol="square", size=10, color=category_color))
+                for category, category_color in zip(categories, colors)
+            ]
+        )
+        fig.update_layout(showlegend=True, legend_title_text=color)
+    return fig
+
+
+class IntervalIndex:
+    """Tasks sorted by start, for fast "what overlaps this window" queries.
+
+    Alongside the sorted starts it keeps the running maximum of the ends:
+    every task before the first position where that maximum passes the
+    window start has already finished, so two ``searchsorted`` calls bound
+    the candidates. Build it once per schedule; queries take milliseconds
+    on a million tasks unless the window covers most of them.
+    """
+
+    def __init__(self, start, end):
+        start, end = to_epoch_ms(start), to_epoch_ms(end)
+        self.order = np.argsort(start, kind="stable")
+        self.start = start[self.order]
+        self.end = end[self.order]
+        self.max_end = np.maximum.accumulate(self.end) if len(self.end) else self.end
+
+    def __len__(self):
+        return len(self.order)
+
+    @property
+    def bounds(self):
+        """(earliest start, latest end) over all tasks."""
+        return self.start[0], self.max_end[-1]
+
+    def query(self, window_start, window_end):
+        """Positions (in the original order) of tasks overlapping the window.
+
+        A task overlaps if it starts before ``window_end`` and ends after
+        ``window_start``; bounds are dates, strings or epoch milliseconds.
+        """
+        # Parsed one at a time: relayout bounds can mix "2023-01-05" and
+        # "2023-01-05 12:30:00.5" styles
+        low, high = to_epoch_ms([window_start])[0], to_epoch_ms([window_end])[0]
+        first = np.searchsorted(self.max_end, low, side="right")
+        last = np.searchsorted(self.start, high, side="left")
+        candidates = np.arange(first, max(first, last))
+        candidates = candidates[self.end[candidates] > low]
+        return self.order[candidates]
+
+
+def window_from_relayout(relayout_data):
+    """(start, end) of the x-axis from a Dash ``relayoutData`` event.
+
+    Returns ``AUTORANGE`` when the x-axis was reset (double click) and None
+    for events that don't touch the x-axis, which callbacks can answer with
+    ``dash.no_update``.
+    """
+    if not relayout_data:
+        return None
+    if "xaxis.range[0]" in relayout_data:
+        return relayout_data["xaxis.range[0]"], relayout_data["xaxis.range[1]"]
+    if "xaxis.range" in relayout_data:
+        return tuple(relayout_data["xaxis.range"])
+    if relayout_data.get("xaxis.autorange"):
+        return AUTORANGE
+    return None
+
+
+def utilization(start, end, groups=None, n_bins=500, grid=None, how="mean"):
+    """Number of tasks running over time, per resource, on a fixed time grid.
+
+    ``grid`` holds the grid times (dates or epoch ms); by default ``n_bins``
+    equal steps from the first start to the last end. With ``how="mean"``
+    the result is the average number of running tasks within each step, so
+    tasks shorter than a step still count; ``how="sample"`` counts the tasks
+    running at each grid time.
+
+    Every task adds a +1 event at its start and a -1 event at its end. The
+    events are binned onto the grid per group with ``np.bincount`` and
+    accumulated with ``np.cumsum``, so millions of tasks need no Python
+    loop. The mean uses the same sweep on the running integral of the count.
+
+    Returns ``(times, load, group_labels)``: grid times in epoch ms (the step
+    starts for ``how="mean"``), a (groups x times) array and the group labels
+    (sorted, as in ``pack_lanes``).
+    """
+    if how not in ("mean", "sample"):
+        raise ValueError(f"how must be 'mean' or 'sample', got {how!r}")
+    start, end = to_epoch_ms(start), to_epoch_ms(end)
+    if groups is None:
+        codes, labels = np.zeros(len(start), dtype=np.int64), np.array([""], dtype=object)
+    else:
+        codes, labels = pd.factorize(np.asarray(groups), sort=True)
+        labels = np.asarray(labels, dtype=object)
+    if grid is None:
+        low, high = (start.min(), end.max()) if len(start) else (0.0, 1.0)
+        grid = np.linspace(low, high, n_bins + 1)
+    grid = to_epoch_ms(grid)
+
+    # Event positions: grid points at or after the start (+1) / end (-1)
+    width = len(grid) + 1
+    at_start = codes * width + np.searchsorted(grid, start, side="left")
+    at_end = codes * width + np.searchsorted(grid, end, side="left")
+    size = len(labels) * width
+    slope = np.bincount(at_start, minlength=size) - np.bincount(at_end, minlength=size)
+    running = np.cumsum(slope.reshape(len(labels), width)[:, :-1], axis=1)
+    if how == "sample":
+        return grid, running, labels
+
+    # Busy time up to grid point g: sum of (min(g, end) - start) over started
+    # tasks, i.e. running * g plus a cumulative -start/+end offset. Shifting
+    # to the first grid point keeps the float sums small.
+    origin = grid[0]
+    offset = np.bincount(at_start, weights=origin - start, minlength=size) + np.bincount(
+        at_end, weights=end - origin, minlength=size
+    )
+    offset = np.cumsum(offset.reshape(len(labels), width)[:, :-1], axis=1)
+    busy = running * (grid - origin) + offset
+    return grid[:-1], np.diff(busy, axis=1) / np.diff(grid), labels
+
+
+def utilization_figure(
+    start,
+    end,
+    groups=None,
+    hovertext=None,
+    n_bins=500,
+    color_discrete_sequence=None,
+    row_height=12,
+    load_height=250,
+    title=None,
+):
+    """Lane-packed timeline with a stacked utilization area underneath.
+
+    The two panels share the time axis, so zooming the timeline zooms the
+    load chart. The area shows the mean number of running tasks per step
+    (see ``utilization``), one stacked trace per resource.
+    """
+    start_ms, end_ms = to_epoch_ms(start), to_epoch_ms(end)
+    timeline = lane_figure(start_ms, end_ms, groups, hovertext=hovertext, row_height=row_height)
+    times, load, labels = utilization(start_ms, end_ms, groups, n_bins=n_bins)
+
+    timeline_height = timeline.layout.height
+    fig = make_subplots(
+        rows=2,
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.02,
+        row_heights=[timeline_height, load_height],
+    )
+    fig.add_trace(timeline.data[0], row=1, col=1)
+    sequence = color_discrete_sequence or px.colors.qualitative.Plotly
+    for i, (label, group_load) in enumerate(zip(labels, load)):
+        fig.add_trace(
+            go.Scatter(
+                x=times,
+                y=group_load,
+                name=str(label) or "Tasks",
+                mode="lines",
+                line=dict(width=0.5, shape="hv", color=sequence[i % len(sequence)]),
+                stackgroup="load",
+                hovertemplate="%{x|%Y-%m-%d %H:%M}: %{y:.1f} running<extra>%{fullData.name}</extra>",
+            ),
+            row=2,
+            col=1,
+        )
+    fig.update_yaxes(timeline.layout.yaxis.to_plotly_json(), row=1, col=1)
+    fig.update_yaxes(title_text="Running tasks", row=2, col=1)
+    fig.update_xaxes(type="date")
+    fig.update_layout(
+        title=title,
+        height=timeline_height + load_height,
+        bargap=0,
+        showlegend=len(labels) <= 30,
+        margin=dict(l=10, r=10, t=60 if title else 20, b=40),
+    )
+    return fig
+
+
+class TimelinePyramid:
+    """Multi-resolution view of a large schedule.
+
+    At build time the tasks are packed into lanes and indexed
+    (``IntervalIndex``), and their per-resource occupancy is precomputed on
+    day, week and month grids (``utilization``). ``figure`` then draws:
+    - individual bars when the visible tasks would be at least
+      ``min_task_px`` pixels wide and there are at most ``max_bars`` of them
+    - otherwise one heatmap band per resource at the finest level whose
+      steps are at least ``min_bin_px`` pixels wide
+
+    so a multi-year view costs a few thousand cells instead of millions of
+    bars, and zooming in brings the bars back.
+    """
+
+    LEVELS = {"day": ("D", 86_400_000), "week": ("W-MON", 7 * 86_400_000), "month": ("MS", 30.44 * 86_400_000)}
+
+    def __init__(
+        self,
+        start,
+        end,
+        groups=None,
+        levels=("day", "week", "month"),
+        min_task_px=2,
+        min_bin_px=3,
+        max_bars=20_000,
+    ):
+        self.start, self.end = to_epoch_ms(start), to_epoch_ms(end)
+        self.min_task_px, self.min_bin_px, self.max_bars = min_task_px, min_bin_px, max_bars
+        lanes, self.codes, self.labels, lane_counts = pack_lanes(self.start, self.end, groups)
+        self.rows, self.centers, _ = lane_rows(lanes, self.codes, lane_counts)
+        self.n_rows = int(self.rows.max(initial=0)) + 1
+        self.index = IntervalIndex(self.start, self.end)
+        self.typical_ms = float(np.median(self.end - self.start)) if len(self.start) else 0.0
+
+        # Calendar-aligned grids from before the first start to past the last end
+        low, high = self.index.bounds if len(self.index) else (0.0, 1.0)
+        self.levels = {}
+        for name in levels:
+            freq, _ = self.LEVELS[name]
+            step = pd.tseries.frequencies.to_offset(freq)
+            first = pd.Timestamp(low, unit="ms").normalize() - step
+            grid = to_epoch_ms(pd.date_range(first, pd.Timestamp(high, unit="ms") + step, freq=freq))
+            _, load, _ = utilization(self.start, self.end, self.codes, grid=grid)
+            self.levels[name] = (grid, load.astype(np.float32))
+
+    def choose(self, window_start, window_end, width_px=1200):
+        """``(level, visible)``: the level to draw (None for bars) and, for
+        bars, the positions of the visible tasks."""
+        low, high = to_epoch_ms([window_start])[0], to_epoch_ms([window_end])[0]
+        px_per_ms = width_px / max(high - low, 1.0)
+        if self.typical_ms * px_per_ms >= self.min_task_px:
+            visible = self.index.query(window_start, window_end)
+            if len(visible) <= self.max_bars:
+                return None, visible
+        # Finest level whose steps are still wide enough to see
+        for name, (grid, _) in self.levels.items():
+            if self.LEVELS[name][1] * px_per_ms >= self.min_bin_px:
+                return name, None
+        # Even the coarsest steps are crowded: use them anyway
+        return name, None
+
+    def figure(self, window_start=None, window_end=None, width_px=1200, height=700, colorscale="Blues", title=None):
+        """Bars or occupancy bands for the window (default: everything)."""
+        if window_start is None or window_end is None:
+            window_start, window_end = self.index.bounds
+        level, visible = self.choose(window_start, window_end, width_px)
+        window = [pd.Timestamp(to_epoch_ms([bound])[0], unit="ms").isoformat() for bound in (window_start, window_end)]
+
+        if level is None:
+            fig = timeline_figure(
+                self.start[visible],
+                self.end[visible],
+                self.rows[visible],
+                self.centers,
+                self.labels,
+                n_rows=self.n_rows,
+                title=title or f"{len(visible):,} tasks",
+            )
+        else:
+            grid, load = self.levels[level]
+            # Bins overlapping the window, drawn with their edges
+            low, high = to_epoch_ms(window)
+            first = max(np.searchsorted(grid, low, side="right") - 1, 0)
+            last = min(np.searchsorted(grid, high, side="left"), len(grid) - 1)
+            band = go.Heatmap(
+                x=grid[first : last + 1],
+                y=self.labels.astype(str),
+                z=load[:, first:last],
+                colorscale=colorscale,
+                zmin=0,
+                colorbar=dict(title="Running tasks", thickness=12),
+                hovertemplate="%{y}<br>%{x|%Y-%m-%d}: %{z:.1f} running<extra></extra>",
+            )
+            fig = go.Figure(data=[band])
+            fig.update_layout(
+                title=title or f"{level.capitalize()} occupancy of {len(self.index):,} tasks (zoom in for tasks)",
+                xaxis=dict(type="date"),
+                yaxis=dict(autorange="reversed", showticklabels=len(self.labels) <= MAX_TICKS, showgrid=False),
+                margin=dict(l=10, r=10, t=60, b=40),
+            )
+        fig.update_layout(height=height, xaxis_range=window)
+        return fig
@@ -0,0 +1,84 @@
+# %%
+"""
+Lane-Packed Gantt Charts
+========================
+
+Gantt_Chart.py draws one row per task with px.timeline. That is fine for
+five tasks but not for a schedule with 100k of them. gantt_engine.py packs
+each resource's tasks into as few lanes as possible, so the figure height
+depends on how many tasks run at the same time, not on how many there are.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from gantt_engine import lane_figure, pack_lanes, to_epoch_ms
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: the multi-resource schedule from Gantt_Chart.py, one row per team
+# ==============================================================================
+df = pd.DataFrame(
+    {
+        "Task": ["Planning", "Planning", "Design", "Design", "Development", "Development", "Testing", "Testing"],
+        "Resource": ["Team A", "Team B", "Team A", "Team C", "Team B", "Team D", "Team A", "Team C"],
+        "Start": ["2023-01-01", "2023-01-05", "2023-01-15", "2023-02-01", "2023-02-10", "2023-03-01", "2023-03-05", "2023-04-01"],
+        "End": ["2023-01-14", "2023-01-19", "2023-01-31", "2023-02-14", "2023-03-21", "2023-03-28", "2023-03-19", "2023-04-07"],
+    }
+)
+
+fig = lane_figure(
+    df["Start"],
+    df["End"],
+    groups=df["Resource"],
+    hovertext=df["Task"] + " (" + df["Resource"] + ")",
+    row_height=40,
+    title="Project Schedule with Multiple Resources (packed lanes)",
+)
+fig.show()
+
+# %%
+# ==============================================================================
+# DATA: 1M tasks over 500 resources and five years
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_tasks = 1_000_000
+start = np.datetime64("2020-01-01", "ms") + rng.integers(0, 5 * 365 * 86_400_000, n_tasks).astype("timedelta64[ms]")
+duration = (rng.gamma(2.0, 3.0, n_tasks) * 86_400_000).astype("timedelta64[ms]")
+df_tasks = pd.DataFrame(
+    {
+        "Task": "Task " + pd.RangeIndex(n_tasks).astype(str),
+        "Resource": "Resource " + pd.Series(rng.integers(0, 500, n_tasks)).astype(str),
+        "Start": start,
+        "Finish": start + duration,
+    }
+)
+
+start_ms, end_ms = to_epoch_ms(df_tasks["Start"]), to_epoch_ms(df_tasks["Finish"])
+t0 = time.perf_counter()
+lanes, codes, labels, lane_counts = pack_lanes(start_ms, end_ms, df_tasks["Resource"])
+print(f"Packed {n_tasks:,} tasks into {lane_counts.sum():,} lanes in {time.perf_counter() - t0:.2f}s")
+print(f"Lanes per resource: {lane_counts.min()}-{lane_counts.max()} (vs {n_tasks // 500:,} tasks per resource)")
+
+# %%
+# ==============================================================================
+# BENCHMARK: px.timeline (one row per task) vs packed lanes on 10k tasks
+# ==============================================================================
+subset = df_tasks[df_tasks["Resource"].isin([f"Resource {i}" for i in range(20)])].head(10_000)
+
+t0 = time.perf_counter()
+fig_px = px.timeline(subset, x_start="Start", x_end="Finish", y="Task", color="Resource")
+px_time = time.perf_counter() - t0
+px_json = len(fig_px.to_json())
+
+t0 = time.perf_counter()
+fig_lanes = lane_figure(subset["Start"], subset["Finish"], groups=subset["Resource"], title="10k tasks, 20 resources")
+lane_time = time.perf_counter() - t0
+lane_json = len(fig_lanes.to_json())
+
+print(f"px.timeline: {px_time:.2f}s, {len(fig_px.data)} traces, {px_json / 1e6:.1f} MB, {len(subset):,} rows")
+print(f"Lanes:       {lane_time:.2f}s, {len(fig_lanes.data)} trace,  {lane_json / 1e6:.1f} MB, height {fig_lanes.layout.height}px")
+fig_lanes.show()
@@ -0,0 +1,76 @@
+# %%
+"""
+Milestones and Vertical Markers in Bulk
+=======================================
+
+Gantt_Chart.py draws milestones as a scatter trace and "Today" with
+add_vline. Every add_vline/add_shape/add_annotation call adds a layout
+object, and with thousands of deadlines, releases and holidays both
+building the figure and every relayout slow down. gantt_engine.py draws
+any number of vertical markers as one scatter trace on a hidden 0-1
+overlay axis, and milestones as one marker trace.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from gantt_engine import add_marker_lines, gantt_figure, milestone_trace
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: the milestone project from Gantt_Chart.py
+# ==============================================================================
+df = pd.DataFrame(
+    [
+        dict(Task="Project Kickoff", Type="Milestone", Start="2023-06-01", Finish="2023-06-01", Phase="Planning"),
+        dict(Task="Requirements Gathering", Type="Task", Start="2023-06-01", Finish="2023-06-10", Phase="Planning"),
+        dict(Task="Scope Definition", Type="Task", Start="2023-06-08", Finish="2023-06-15", Phase="Planning"),
+        dict(Task="Planning Complete", Type="Milestone", Start="2023-06-15", Finish="2023-06-15", Phase="Planning"),
+        dict(Task="Architecture Design", Type="Task", Start="2023-06-16", Finish="2023-06-25", Phase="Design"),
+        dict(Task="UI/UX Design", Type="Task", Start="2023-06-16", Finish="2023-07-01", Phase="Design"),
+        dict(Task="Design Approval", Type="Milestone", Start="2023-07-01", Finish="2023-07-01", Phase="Design"),
+        dict(Task="Backend Development", Type="Task", Start="2023-07-02", Finish="2023-07-31", Phase="Development"),
+        dict(Task="Frontend Development", Type="Task", Start="2023-07-02", Finish="2023-08-05", Phase="Development"),
+        dict(Task="Development Complete", Type="Milestone", Start="2023-08-05", Finish="2023-08-05", Phase="Development"),
+        dict(Task="Integration Testing", Type="Task", Start="2023-08-06", Finish="2023-08-20", Phase="Testing"),
+        dict(Task="Go Live", Type="Milestone", Start="2023-09-15", Finish="2023-09-15", Phase="Deployment"),
+    ]
+)
+
+fig = gantt_figure(df, x_start="Start", x_end="Finish", y="Task", color="Phase", hover_name="Task", title="Project Timeline with Milestones")
+
+# gantt_figure puts task i on row i, in order of first appearance
+rows, _ = pd.factorize(df["Task"])
+milestones = (df["Type"] == "Milestone").to_numpy()
+fig.add_trace(milestone_trace(df.loc[milestones, "Start"], rows[milestones], labels=df.loc[milestones, "Task"]))
+add_marker_lines(fig, ["2023-07-15"], labels=["Today"], color="red", width=2)
+fig.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 2: 5,000 markers, one trace vs one add_vline each
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_markers = 5_000
+marker_dates = np.datetime64("2023-01-01", "ms") + rng.integers(0, 365 * 86_400_000, n_markers).astype("timedelta64[ms]")
+marker_labels = "Release " + pd.RangeIndex(n_markers).astype(str)
+
+t0 = time.perf_counter()
+fig = go.Figure()
+add_marker_lines(fig, marker_dates, labels=marker_labels, color="gray", dash="dot")
+trace_time = time.perf_counter() - t0
+print(f"One trace, {n_markers:,} markers: {trace_time * 1000:.0f} ms, {len(fig.to_json()) / 1e3:.0f} kB, {len(fig.layout.shapes)} shapes")
+
+# add_vline gets slower with every shape already in the layout, so time 100
+# only (as epoch ms: its annotation placement can't average datetime64)
+n_vlines = 100
+marker_ms = marker_dates.astype(np.int64).astype(np.float64)
+t0 = time.perf_counter()
+fig_vlines = go.Figure()
+for date, label in zip(marker_ms[:n_vlines], marker_labels[:n_vlines]):
+    fig_vlines.add_vline(x=date, line_dash="dot", line_color="gray", annotation_text=label)
+vline_time = time.perf_counter() - t0
+print(f"add_vline, {n_vlines} markers: {vline_time:.2f}s, {len(fig_vlines.layout.shapes)} shapes + {len(fig_vlines.layout.annotations)} annotations")
@@ -0,0 +1,87 @@
+# %%
+"""
+Progress Overlays on Gantt Bars
+===============================
+
+Example 3 in Gantt_Chart.py has a Progress column but can only recolor
+the bars by it. gantt_figure(progress=...) fills each bar from its start
+to start + progress x duration. The filled parts are computed as arrays
+and drawn as one extra bar trace, however many tasks there are.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from gantt_engine import gantt_figure, progress_trace, to_epoch_ms
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: the progress tracking data from Gantt_Chart.py
+# ==============================================================================
+df = pd.DataFrame(
+    {
+        "Task": ["Planning", "Design", "Development", "Testing", "Deployment"],
+        "Start": ["2023-01-01", "2023-01-15", "2023-02-01", "2023-03-01", "2023-04-01"],
+        "End": ["2023-01-14", "2023-01-31", "2023-02-28", "2023-03-14", "2023-04-07"],
+        "Progress": [75, 50, 90, 30, 20],
+    }
+)
+
+fig = gantt_figure(
+    df,
+    x_start="Start",
+    x_end="End",
+    y="Task",
+    hover_name="Task",
+    progress="Progress",
+    progress_scale=100,
+    row_height=50,
+    title="Project Schedule with Progress Tracking",
+)
+fig.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 2: 50k tasks, one overlay trace vs one shape per task
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_tasks = 50_000
+start = np.datetime64("2023-01-01", "ms") + rng.integers(0, 365 * 86_400_000, n_tasks).astype("timedelta64[ms]")
+tasks = pd.DataFrame(
+    {
+        "Task": "Task " + pd.RangeIndex(n_tasks).astype(str),
+        "Team": "Team " + pd.Series(rng.integers(0, 20, n_tasks)).astype(str),
+        "Start": start,
+        "Finish": start + (rng.gamma(2.0, 3.0, n_tasks) * 86_400_000).astype("timedelta64[ms]"),
+        "Progress": rng.uniform(0, 1, n_tasks),
+    }
+)
+
+t0 = time.perf_counter()
+fig = gantt_figure(tasks, "Start", "Finish", "Team", hover_name="Task", progress="Progress", pack=True, title="50k tasks with progress")
+print(f"gantt_figure with progress: {time.perf_counter() - t0:.2f}s, {len(fig.data)} traces")
+fig.show()
+
+# The usual alternative: one rectangle per task (timed on 200 tasks only;
+# every add_shape call copies the shapes added so far)
+sample = tasks.head(200)
+start_ms, end_ms = to_epoch_ms(sample["Start"]), to_epoch_ms(sample["Finish"])
+t0 = time.perf_counter()
+fig_shapes = go.Figure()
+for row, (task_start, task_end, done) in enumerate(zip(start_ms, end_ms, sample["Progress"])):
+    fig_shapes.add_shape(type="rect", x0=task_start, x1=task_start + done * (task_end - task_start), y0=row - 0.2, y1=row + 0.2)
+shape_time = time.perf_counter() - t0
+print(f"add_shape on {len(sample)} tasks: {shape_time:.2f}s, and it grows faster than the task count")
+
+# %%
+# ==============================================================================
+# EXAMPLE 3: adding the overlay to an existing timeline
+# ==============================================================================
+# progress_trace takes the same arrays as the bars it sits on
+fig = gantt_figure(df, x_start="Start", x_end="End", y="Task", row_height=50, title="Overlay added afterwards")
+rows = np.arange(len(df))
+fig.add_trace(progress_trace(to_epoch_ms(df["Start"]), to_epoch_ms(df["End"]), rows, df["Progress"] / 100, color="#00cc96", width=0.8))
+fig.show()
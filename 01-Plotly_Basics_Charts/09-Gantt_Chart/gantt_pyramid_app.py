@@ -0,0 +1,71 @@
+# %%
+"""
+Dash App: Multi-Resolution Gantt Chart
+======================================
+
+A ten-year schedule of a million tasks can't be drawn bar by bar, and
+there is no point: at that zoom a task is a fraction of a pixel. The
+TimelinePyramid in gantt_engine.py precomputes how busy every team is per
+day, week and month. Zoomed out, the app shows those occupancy bands;
+zoom in far enough for tasks to be a few pixels wide and it switches to
+the individual bars.
+
+Run the file and open http://127.0.0.1:8050 to try the app.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+from dash import Dash, Input, Output, dcc, html, no_update
+
+from gantt_engine import TimelinePyramid, window_from_relayout
+
+DAY_MS = 86_400_000
+
+# %%
+# ==============================================================================
+# DATA: 1M tasks over 40 teams and ten years
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_tasks = 1_000_000
+start_ms = (np.datetime64("2015-01-01", "ms").astype(np.int64) + rng.integers(0, 3650 * DAY_MS, n_tasks)).astype(np.float64)
+end_ms = start_ms + rng.gamma(2.0, 0.25, n_tasks) * DAY_MS
+teams = "Team " + pd.Series(rng.integers(0, 40, n_tasks)).astype(str).str.zfill(2)
+
+t0 = time.perf_counter()
+pyramid = TimelinePyramid(start_ms, end_ms, teams)
+print(f"Built the pyramid for {n_tasks:,} tasks in {time.perf_counter() - t0:.2f}s")
+for name, (grid, load) in pyramid.levels.items():
+    print(f"  {name:<5}: {load.shape[1]:>5,} steps x {load.shape[0]} teams")
+
+for window in [(None, None), ("2019-01-01", "2020-01-01"), ("2019-06-01", "2019-06-15")]:
+    t0 = time.perf_counter()
+    fig = pyramid.figure(*window)
+    print(f"Window {window}: {fig.data[0].type}, {(time.perf_counter() - t0) * 1000:.0f} ms, {len(fig.to_json()) / 1e3:.0f} kB")
+
+
+# %%
+# ==============================================================================
+# DASH APP
+# ==============================================================================
+app = Dash(__name__)
+app.layout = html.Div([dcc.Graph(id="gantt-pyramid", figure=pyramid.figure())])
+
+
+@app.callback(
+    Output("gantt-pyramid", "figure"),
+    Input("gantt-pyramid", "relayoutData"),
+    prevent_initial_call=True,
+)
+def zoom(relayout_data):
+    window = window_from_relayout(relayout_data)
+    if window is None:
+        # Not an x-axis change (e.g. a y-axis pan): keep the figure
+        return no_update
+    # AUTORANGE (double click) is (None, None), the whole schedule
+    return pyramid.figure(*window)
+
+
+if __name__ == "__main__":
+    app.run(debug=True)
@@ -0,0 +1,169 @@
+"""
+Critical Path Scheduling for Gantt Charts
+=========================================
+
+Gantt_Chart.py only draws the dates it's given. This module works the
+dates out from task durations and dependencies (the critical path method):
+- Earliest start/finish from a forward pass in topological order
+- Latest start/finish from a backward pass in reverse order
+- Slack (how long a task can slip without delaying the project); tasks
+  with zero slack form the critical path
+
+The topological order is built level by level (Kahn's algorithm), and
+each level is one vectorized NumPy step over its outgoing edges. Every
+task and every dependency is touched a constant number of times, but each
+level also costs a fixed ~20 microseconds, so the time depends on the
+depth of the graph as much as its size: 100k tasks in ~700 levels take
+under 0.1s, while a 100k-task chain (100k levels) takes about 2s.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from gantt_engine import gantt_figure
+
+# Shared helpers live in 01-Plotly_Basics_Charts/plotly_perf
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from plotly_perf.csr import csr_gather, csr_index
+
+
+def critical_path_arrays(durations, predecessors, successors):
+    """Earliest/latest start and finish for a task graph given as arrays.
+
+    ``durations`` has one entry per task; ``predecessors[k]`` must finish
+    before ``successors[k]`` starts (task positions). Returns a dict of
+    ``earliest_start``, ``earliest_finish``, ``latest_start``,
+    ``latest_finish``, ``slack`` and ``level`` (the task's step in the
+    topological order). Raises ValueError if the dependencies contain a
+    cycle.
+    """
+    durations = np.asarray(durations, dtype=np.float64)
+    predecessors = np.asarray(predecessors, dtype=np.int64)
+    successors = np.asarray(successors, dtype=np.int64)
+    n_tasks = len(durations)
+
+    # Edges grouped by predecessor: edges of task t are order[offsets[t]:offsets[t + 1]]
+    offsets, order = csr_index(predecessors, n_tasks)
+    waiting = np.bincount(successors, minlength=n_tasks)
+
+    # Forward pass: a level is every task whose predecessors are all done
+    earliest_start = np.zeros(n_tasks)
+    level = np.full(n_tasks, -1, dtype=np.int64)
+    levels = []
+    frontier = np.flatnonzero(waiting == 0)
+    while len(frontier):
+        level[frontier] = len(levels)
+        edges = csr_gather(frontier, offsets, order)
+        levels.append((frontier, edges))
+        source, target = predecessors[edges], successors[edges]
+        np.maximum.at(earliest_start, target, earliest_start[source] + durations[source])
+        np.subtract.at(waiting, target, 1)
+        candidates = np.unique(target)
+        frontier = candidates[waiting[candidates] == 0]
+
+    if (level < 0).any():
+        stuck = np.flatnonzero(level < 0)
+        raise ValueError(f"Dependencies contain a cycle through {len(stuck)} tasks (e.g. positions {stuck[:5].tolist()})")
+
+    # Backward pass: finish as late as the earliest successor allows
+    earliest_finish = earliest_start + durations
+    latest_finish = np.full(n_tasks, earliest_finish.max(initial=0))
+    for frontier, edges in reversed(levels):
+        source, target = predecessors[edges], successors[edges]
+        np.minimum.at(latest_finish, source, latest_finish[target] - durations[target])
+
+    latest_start = latest_finish - durations
+    return dict(
+        earliest_start=earliest_start,
+        earliest_finish=earliest_finish,
+        latest_start=latest_start,
+        latest_finish=latest_finish,
+        slack=latest_start - earliest_start,
+        level=level,
+    )
+
+
+def _dependency_pairs(df, task, dependencies, sep):
+    # (predecessor, successor) names from a column of lists/strings or a pairs frame
+    if isinstance(dependencies, pd.DataFrame):
+        return dependencies.iloc[:, 0].to_numpy(), dependencies.iloc[:, 1].to_numpy()
+    lists = df[dependencies].dropna()
+    if not pd.api.types.is_numeric_dtype(lists):
+        # Strings are split, lists pass through (.str gives NaN for them)
+        split = lists.astype(object).str.split(sep)
+        lists = split.where(split.notna(), lists)
+    exploded = lists.explode().dropna().astype(object)
+    if pd.api.types.infer_dtype(exploded) in ("string", "mixed", "mixed-integer"):
+        # Strip the strings only (.str gives NaN for the rest); other ids,
+        # e.g. integers, keep their type
+        stripped = exploded.str.strip()
+        exploded = stripped.where(stripped.notna(), exploded)
+        exploded = exploded[exploded != ""]
+    return exploded.to_numpy(), df.loc[exploded.index, task].to_numpy()
+
+
+def _task_positions(names, tasks):
+    # Positions of ``tasks`` in ``names``, compared in the names' own dtype so
+    # "3" split from "1, 3" finds task 3 when tasks are numbered
+    tasks = pd.Index(tasks, dtype=object)
+    try:
+        tasks = tasks.astype(names.dtype)
+    except (TypeError, ValueError):
+        pass
+    return names.get_indexer(tasks)
+
+
+def critical_path(df, task="Task", duration="Duration", dependencies="Depends On", project_start=None, sep=",", unit="D"):
+    """Schedule ``df`` with the critical path method.
+
+    ``duration`` is in ``unit`` (days by default). ``dependencies`` names a
+    column holding each task's predecessors (a list or a ``sep``-separated
+    string), or is a DataFrame of (predecessor, successor) task names.
+
+    Returns a copy of ``df`` with Start/Finish (earliest dates from
+    ``project_start``), Latest Start/Latest Finish, Slack (in ``unit``) and
+    a boolean Critical column. Dependencies naming tasks that aren't in
+    ``df`` raise ValueError.
+    """
+    names = pd.Index(df[task])
+    if not names.is_unique:
+        raise ValueError(f"Task names in {task!r} must be unique")
+    before, after = _dependency_pairs(df, task, dependencies, sep)
+    predecessors, successors = _task_positions(names, before), _task_positions(names, after)
+    for role, named, positions in (("predecessor", before, predecessors), ("successor", after, successors)):
+        if (positions < 0).any():
+            missing = pd.unique(np.asarray(named)[positions < 0])
+            raise ValueError(f"Unknown {role} tasks: {missing[:5].tolist()}")
+
+    result = critical_path_arrays(df[duration].to_numpy(dtype=np.float64), predecessors, successors)
+    origin = pd.Timestamp(project_start if project_start is not None else pd.Timestamp.today().normalize())
+    step = pd.Timedelta(1, unit=unit)
+
+    scheduled = df.copy()
+    scheduled["Start"] = origin + result["earliest_start"] * step
+    scheduled["Finish"] = origin + result["earliest_finish"] * step
+    scheduled["Latest Start"] = origin + result["latest_start"] * step
+    scheduled["Latest Finish"] = origin + result["latest_finish"] * step
+    scheduled["Slack"] = result["slack"]
+    # Durations can be fractional, so allow for rounding in the passes
+    scheduled["Critical"] = np.isclose(result["slack"], 0, atol=1e-9 * max(1.0, result["latest_finish"].max(initial=0)))
+    return scheduled
+
+
+def critical_path_figure(scheduled, task="Task", title="Critical path", **gantt_kwargs):
+    """Gantt chart of a ``critical_path`` result with critical tasks in red."""
+    status = np.where(scheduled["Critical"], "Critical", "Has slack")
+    return gantt_figure(
+        scheduled.assign(Status=status),
+        x_start="Start",
+        x_end="Finish",
+        y=task,
+        color="Status",
+        hover_name=task,
+        color_discrete_map={"Critical": "#d62728", "Has slack": "#9fb3c8"},
+        title=title,
+        **gantt_kwargs,
+    )
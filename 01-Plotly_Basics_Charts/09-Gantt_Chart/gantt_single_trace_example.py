@@ -0,0 +1,80 @@
+# %%
+"""
+Single-Trace Gantt Charts
+=========================
+
+px.timeline(color="Department") creates one bar trace per department. With
+hundreds of resources that means hundreds of traces, and every redraw
+walks all of them. gantt_figure() draws every bar in one trace and colors
+the bars with integer codes through a discrete colorscale. The legend
+becomes one empty marker trace per category, or is left out when there
+are too many categories to read.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from gantt_engine import gantt_figure
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: "Project Tasks by Department" from Gantt_Chart.py
+# ==============================================================================
+tasks = pd.DataFrame(
+    [
+        dict(Task="Market Research", Department="Marketing", Start="2023-03-01", Finish="2023-03-15"),
+        dict(Task="Competitor Analysis", Department="Marketing", Start="2023-03-10", Finish="2023-03-25"),
+        dict(Task="UI/UX Design", Department="Design", Start="2023-03-20", Finish="2023-04-10"),
+        dict(Task="Frontend Development", Department="Engineering", Start="2023-04-01", Finish="2023-04-30"),
+        dict(Task="Backend Development", Department="Engineering", Start="2023-04-05", Finish="2023-05-10"),
+        dict(Task="Database Setup", Department="Engineering", Start="2023-03-25", Finish="2023-04-15"),
+        dict(Task="Quality Assurance", Department="QA", Start="2023-04-20", Finish="2023-05-15"),
+        dict(Task="User Documentation", Department="Support", Start="2023-05-01", Finish="2023-05-20"),
+    ]
+)
+
+fig = gantt_figure(
+    tasks, x_start="Start", x_end="Finish", y="Task", color="Department", hover_name="Task",
+    title="Project Tasks by Department (one bar trace)",
+)
+fig.show()
+
+# %%
+# ==============================================================================
+# BENCHMARK: 300 resources, 20k tasks
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_tasks = 20_000
+start = np.datetime64("2023-01-01", "ms") + rng.integers(0, 365 * 86_400_000, n_tasks).astype("timedelta64[ms]")
+df_tasks = pd.DataFrame(
+    {
+        "Task": "Task " + pd.RangeIndex(n_tasks).astype(str),
+        "Resource": "Resource " + pd.Series(rng.integers(0, 300, n_tasks)).astype(str),
+        "Start": start,
+        "Finish": start + (rng.gamma(2.0, 2.0, n_tasks) * 86_400_000).astype("timedelta64[ms]"),
+    }
+)
+
+t0 = time.perf_counter()
+fig_px = px.timeline(df_tasks, x_start="Start", x_end="Finish", y="Resource", color="Resource", hover_name="Task")
+px_time = time.perf_counter() - t0
+t0 = time.perf_counter()
+px_json = len(fig_px.to_json())
+px_json_time = time.perf_counter() - t0
+
+t0 = time.perf_counter()
+fig_single = gantt_figure(
+    df_tasks, x_start="Start", x_end="Finish", y="Resource", color="Resource", hover_name="Task", pack=True
+)
+single_time = time.perf_counter() - t0
+t0 = time.perf_counter()
+single_json = len(fig_single.to_json())
+single_json_time = time.perf_counter() - t0
+
+print(f"{'':<14}{'traces':>8}{'build':>9}{'to_json':>9}{'payload':>10}")
+print(f"{'px.timeline':<14}{len(fig_px.data):>8}{px_time:>8.2f}s{px_json_time:>8.2f}s{px_json / 1e6:>8.2f}MB")
+print(f"{'gantt_figure':<14}{len(fig_single.data):>8}{single_time:>8.2f}s{single_json_time:>8.2f}s{single_json / 1e6:>8.2f}MB")
+fig_single.show()
@@ -0,0 +1,77 @@
+# %%
+"""
+Resource Utilization under a Gantt Chart
+========================================
+
+The multi-resource schedule in Gantt_Chart.py shows who works on what,
+but not how loaded each team is at any time. gantt_engine.utilization
+sweeps the start/end events of every task onto a fixed time grid with
+NumPy (no Python loop), and utilization_figure draws the result as a
+stacked area under the timeline.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from gantt_engine import add_marker_lines, utilization, utilization_figure
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: the multi-resource schedule from Gantt_Chart.py
+# ==============================================================================
+df = pd.DataFrame(
+    {
+        "Task": ["Planning", "Planning", "Design", "Design", "Development", "Development", "Testing", "Testing"],
+        "Resource": ["Team A", "Team B", "Team A", "Team C", "Team B", "Team D", "Team A", "Team C"],
+        "Start": ["2023-01-01", "2023-01-05", "2023-01-15", "2023-02-01", "2023-02-10", "2023-03-01", "2023-03-05", "2023-04-01"],
+        "End": ["2023-01-14", "2023-01-19", "2023-01-31", "2023-02-14", "2023-03-21", "2023-03-28", "2023-03-19", "2023-04-07"],
+    }
+)
+
+fig = utilization_figure(
+    df["Start"],
+    df["End"],
+    groups=df["Resource"],
+    hovertext=df["Task"] + " (" + df["Resource"] + ")",
+    n_bins=98,
+    row_height=40,
+    title="Project Schedule with Team Utilization",
+)
+# The subplots use yaxis and yaxis2, so the marker overlay takes yaxis3
+add_marker_lines(fig, ["2023-03-01"], labels=["Today"], color="red")
+assert fig.layout.yaxis2.visible is not False and fig.data[-1].yaxis == "y3"
+fig.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 2: utilization of 5M tasks over 40 teams
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_tasks = 5_000_000
+start_ms = (np.datetime64("2023-01-01", "ms").astype(np.int64) + rng.integers(0, 365 * 86_400_000, n_tasks)).astype(np.float64)
+end_ms = start_ms + rng.gamma(2.0, 0.5, n_tasks) * 86_400_000
+teams = "Team " + pd.Series(rng.integers(0, 40, n_tasks)).astype(str).str.zfill(2)
+
+t0 = time.perf_counter()
+times, load, labels = utilization(start_ms, end_ms, teams, grid=pd.date_range("2023-01-01", "2024-01-01", freq="D"))
+print(f"Daily utilization of {n_tasks:,} tasks over {len(labels)} teams in {time.perf_counter() - t0:.2f}s")
+print(f"Busiest team-day: {load.max():.0f} tasks running on average, {load.sum(axis=0).max():.0f} across all teams")
+
+daily = pd.DataFrame(load.T, index=pd.to_datetime(times, unit="ms"), columns=labels)
+fig = px.area(daily, title=f"Running tasks per team ({n_tasks:,} tasks, daily mean)")
+fig.update_layout(xaxis_title="", yaxis_title="Running tasks", legend_title_text="Team")
+fig.update_traces(line_width=0.5)
+fig.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 3: timeline and utilization for one week of 5 teams
+# ==============================================================================
+week = (start_ms < np.datetime64("2023-06-08", "ms").astype(np.int64)) & (end_ms > np.datetime64("2023-06-01", "ms").astype(np.int64))
+week &= teams.isin(["Team 00", "Team 01", "Team 02", "Team 03", "Team 04"]).to_numpy()
+fig = utilization_figure(start_ms[week], end_ms[week], teams[week], row_height=6, title=f"{week.sum():,} tasks in one week")
+fig.update_xaxes(range=["2023-06-01", "2023-06-08"])
+fig.show()
@@ -0,0 +1,113 @@
+"""
+Cached Date Parsing for Timeline Inputs
+=======================================
+
+Every Gantt example runs ``pd.to_datetime`` on its Start/Finish strings
+each time the chart is built, and a dashboard callback does that on every
+render. This module parses each date column once:
+- ``parse_epoch_ms`` turns dates, strings or numbers into int64 epoch
+  milliseconds. Strings go through the explicit-format parser (``format=``,
+  or ISO 8601 by default) and only distinct values are parsed, since
+  schedules repeat the same dates many times
+- ``TimelineLoader`` caches the parsed arrays keyed on a hash of the column
+  contents and the format, so repeat renders only hash the column, which
+  costs about half as much as parsing it
+
+The arrays plug straight into gantt_engine (``to_epoch_ms`` passes numbers
+through).
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Shared helpers live in 01-Plotly_Basics_Charts/plotly_perf
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from plotly_perf.cache import ContentCache, column_hash
+
+
+def parse_epoch_ms(values, format=None):
+    """int64 milliseconds since the epoch from dates, strings or numbers.
+
+    Numbers are taken to be epoch milliseconds already. Strings are parsed
+    with ``format`` (a ``strftime`` pattern); without one, ISO 8601 is tried
+    first and pandas' format inference is the fallback. Time zone aware
+    dates are converted to UTC. Missing or unparseable dates raise
+    ValueError.
+    """
+    if not hasattr(values, "dtype"):
+        values = np.asarray(values)
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return np.asarray(values, dtype=np.int64)
+    if isinstance(values.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(values.dtype):
+        dates = pd.DatetimeIndex(values)
+    else:
+        strings = np.asarray(values, dtype=object)
+        # Parse each distinct string once, then gather, unless a sample shows
+        # the values are mostly distinct anyway (e.g. timestamps)
+        sample = strings[:10_000]
+        repeated = len(pd.unique(sample)) * 2 <= len(sample)
+        codes, uniques = pd.factorize(strings) if repeated else (None, strings)
+        try:
+            dates = pd.DatetimeIndex(pd.to_datetime(uniques, format=format or "ISO8601"))
+        except ValueError:
+            if format is not None:
+                raise
+            dates = pd.DatetimeIndex(pd.to_datetime(uniques))
+        if repeated:
+            if (codes < 0).any():
+                raise ValueError("Dates contain missing values")
+            dates = dates.take(codes)
+    if dates.tz is not None:
+        dates = dates.tz_convert("UTC").tz_localize(None)
+    if dates.hasnans:
+        raise ValueError("Dates contain missing values")
+    return dates.as_unit("ms").asi8
+
+
+class TimelineLoader(ContentCache):
+    """Parsed date columns keyed on (column hash, format).
+
+    Equal columns share one parsed array whichever DataFrame they come
+    from, and an edited column is parsed again. Holds at most
+    ``max_entries`` arrays; they are read-only since callers share them.
+    """
+
+    def __init__(self, max_entries=32):
+        super().__init__(max_entries)
+
+    def epoch_ms(self, df, column, format=None, key=None):
+        """int64 epoch milliseconds of ``df[column]``, parsed at most once."""
+        cache_key = (key or column_hash(df[column]), column if key else None, format)
+        return self.lookup(cache_key, lambda: self._parse(df[column], format))
+
+    @staticmethod
+    def _parse(values, format):
+        parsed = parse_epoch_ms(values, format=format)
+        parsed.flags.writeable = False
+        return parsed
+
+    def load(self, df, columns=("Start", "Finish"), format=None, key=None):
+        """``{column: epoch_ms}`` for several columns (see ``epoch_ms``)."""
+        return {column: self.epoch_ms(df, column, format=format, key=key) for column in columns}
+
+
+# Shared by every load_timeline call that doesn't pass its own loader
+default_loader = TimelineLoader()
+
+
+def load_timeline(df, columns=("Start", "Finish"), format=None, loader=None, key=None):
+    """Copy of ``df`` with ``columns`` replaced by cached int64 epoch ms.
+
+    The result can go straight to ``gantt_engine.gantt_figure`` or
+    ``lane_figure``. Pass ``loader=False`` to parse without caching, or
+    ``key`` to identify the data yourself instead of hashing it.
+    """
+    if loader is False:
+        parsed = {column: parse_epoch_ms(df[column], format=format) for column in columns}
+    else:
+        loader = loader if loader is not None else default_loader
+        parsed = loader.load(df, columns, format=format, key=key)
+    return df.assign(**parsed)
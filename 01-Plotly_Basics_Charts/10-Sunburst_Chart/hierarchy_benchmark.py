@@ -0,0 +1,124 @@
+# %%
+"""
+Benchmark: Hierarchical Charts by Leaf Count, Depth, Fan-Out and Skew
+=====================================================================
+
+Generates synthetic hierarchies and measures, for each configuration:
+- px.sunburst / px.treemap / px.icicle with path=[...]
+- the go.* trace path through hierarchy_engine.py (grouping included,
+  cache disabled)
+
+and reports build time, figure JSON size and peak Python memory
+(tracemalloc). Use the results to set row and node limits for dashboards.
+Plotly Express is only timed up to PX_MAX_ROWS rows because it takes
+seconds per 10k rows on deep paths.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from hierarchy_engine import build_hierarchy
+
+# Shared helpers live in 01-Plotly_Basics_Charts/plotly_perf
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from plotly_perf.benchmark import measure
+
+PX_MAX_ROWS = 20_000
+PX_CHARTS = {"sunburst": px.sunburst, "treemap": px.treemap, "icicle": px.icicle}
+
+
+def synthetic_hierarchy(n_rows, depth=3, fan_out=20, skew=1.0, seed=42):
+    """Flat rows with ``depth`` path columns of ``fan_out`` labels each.
+
+    Label k of every level is drawn with probability proportional to
+    1 / (k + 1) ** skew, so skew=0 is uniform and larger values concentrate
+    the rows in a few large branches.
+    """
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, fan_out + 1) ** skew
+    weights /= weights.sum()
+    columns = {
+        f"Level {level}": np.char.add(f"L{level}-", rng.choice(fan_out, n_rows, p=weights).astype(str))
+        for level in range(depth)
+    }
+    columns["Value"] = rng.gamma(2.0, 100.0, n_rows)
+    return pd.DataFrame(columns)
+
+
+def run(configs):
+    results = []
+    for n_rows, depth, fan_out, skew in configs:
+        df = synthetic_hierarchy(n_rows, depth, fan_out, skew)
+        path = [f"Level {level}" for level in range(depth)]
+        methods = {
+            f"go.{kind}": (lambda kind=kind: build_hierarchy(df, path, "Value", cache=False).to_figure(kind))
+            for kind in PX_CHARTS
+        }
+        if n_rows <= PX_MAX_ROWS:
+            methods.update(
+                {f"px.{kind}": (lambda chart=chart: chart(df, path=path, values="Value")) for kind, chart in PX_CHARTS.items()}
+            )
+        nodes = len(build_hierarchy(df, path, "Value", cache=False))
+
+        for method, build in methods.items():
+            seconds, json_bytes, peak = measure(build)
+            results.append(
+                dict(
+                    rows=n_rows, depth=depth, fan_out=fan_out, skew=skew, nodes=nodes, method=method,
+                    seconds=seconds, json_mb=json_bytes / 1e6, peak_mb=peak / 1e6,
+                )
+            )
+            print(
+                f"rows={n_rows:>9,} depth={depth} fan_out={fan_out:>3} skew={skew:.1f} nodes={nodes:>8,} "
+                f"{method:<13} {seconds:8.3f}s {json_bytes / 1e6:7.2f} MB JSON {peak / 1e6:8.1f} MB peak"
+            )
+    return pd.DataFrame(results)
+
+
+# %%
+# ==============================================================================
+# BENCHMARK 1: scaling with the number of rows (depth 3, fan-out 20, skew 1)
+# ==============================================================================
+by_rows = run([(n_rows, 3, 20, 1.0) for n_rows in [1_000, 5_000, 20_000, 100_000, 1_000_000]])
+
+fig = px.line(
+    by_rows,
+    x="rows",
+    y="seconds",
+    color="method",
+    markers=True,
+    log_x=True,
+    log_y=True,
+    title="Figure build time vs rows (depth 3, fan-out 20)",
+)
+fig.show()
+
+# %%
+# ==============================================================================
+# BENCHMARK 2: depth, fan-out and skew at a fixed 20k rows
+# ==============================================================================
+shape_configs = (
+    [(20_000, depth, 10, 1.0) for depth in [2, 4, 6]]
+    + [(20_000, 3, fan_out, 1.0) for fan_out in [5, 50, 200]]
+    + [(20_000, 3, 20, skew) for skew in [0.0, 2.0]]
+)
+by_shape = run(shape_configs)
+
+summary = by_shape.pivot_table(index=["depth", "fan_out", "skew", "nodes"], columns="method", values="seconds")
+print("\nBuild time (s) by hierarchy shape:")
+print(summary.round(3).to_string())
+
+# %%
+# ==============================================================================
+# LIMITS: the largest tested size that builds within a time budget
+# ==============================================================================
+budget = 1.0
+results = pd.concat([by_rows, by_shape])
+within = results[results["seconds"] <= budget]
+limits = within.groupby("method").agg(max_rows=("rows", "max"), max_nodes=("nodes", "max"))
+print(f"\nLargest tested hierarchy built within {budget:.0f}s:")
+print(limits.to_string())
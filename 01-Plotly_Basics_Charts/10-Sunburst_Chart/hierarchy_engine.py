@@ -0,0 +1,663 @@
+"""
+Precomputed Hierarchies for Sunburst, Treemap and Icicle Charts
+===============================================================
+
+``px.sunburst(df, path=[...])`` (and ``px.treemap`` / ``px.icicle``) rebuild
+the ids/parents/values hierarchy from the flat DataFrame on every call. With
+millions of leaves that regrouping dominates the time to draw the chart, and
+a dashboard repeats it on every refresh.
+
+``build_hierarchy`` computes the node table once:
+- Each path level is factorized, and the nodes of a level are the distinct
+  (parent node, label) pairs, found with one ``pd.factorize`` on an int64 key
+- Leaf values are summed with ``np.bincount`` and rolled up level by level
+- Results are cached by a hash of the data plus the path and values column
+- Color columns (weighted mean, mean, sum, min, max, count) are reduced per
+  node from the same row -> leaf mapping, so recoloring never regroups
+- ``compact=True`` sends values, colors and customdata as integer or float32
+  typed arrays instead of float64
+
+``normalize_hierarchy`` does the same for raw ``labels``/``parents`` lists
+(the ``go.Icicle`` style of input): it reports orphans, cycles and duplicate
+labels that Plotly would otherwise drop silently, and fills in totals.
+
+The returned ``Hierarchy`` feeds ``go.Sunburst``, ``go.Treemap`` and
+``go.Icicle`` directly, with ``branchvalues="total"`` like Plotly Express.
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Shared helpers live in 01-Plotly_Basics_Charts/plotly_perf
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from plotly_perf.cache import ContentCache, column_hash, frame_hash
+from plotly_perf.csr import csr_gather, csr_index
+from plotly_perf.hierarchy import TRACE_TYPES, sibling_rank
+
+# Largest magnitude sent as an integer array (Plotly's typed arrays stop at 32 bits)
+INT32_MAX = 2**31 - 1
+
+# Reducers for color columns; min/max combine with their own ufunc
+REDUCERS = ("weighted_mean", "mean", "sum", "count", "min", "max")
+EXTREMA = {"min": (np.minimum, np.inf), "max": (np.maximum, -np.inf)}
+
+
+def compact_array(values, float32=True):
+    """``values`` as the smallest typed array that keeps them usable.
+
+    Whole numbers become integers (Plotly sends the smallest integer type
+    that fits); other values become float32 if ``float32`` is set. float32
+    keeps about 7 significant digits, well within the 1e-6 relative
+    tolerance Plotly.js allows when checking that a parent's total is at
+    least the sum of its children.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    finite = values[np.isfinite(values)]
+    if len(finite) == len(values) and (finite == np.round(finite)).all() and np.abs(finite).max(initial=0) <= INT32_MAX:
+        return values.astype(np.int64)
+    return values.astype(np.float32) if float32 else values
+
+
+def short_ids(n_nodes):
+    """Base-36 position ids ("0", "1", ... "a", ...) for compact payloads."""
+    digits = np.array(list("0123456789abcdefghijklmnopqrstuvwxyz"), dtype=object)
+    ids = digits[np.arange(n_nodes) % 36]
+    remaining = np.arange(n_nodes) // 36
+    while remaining.any():
+        ids = np.where(remaining > 0, digits[remaining % 36] + ids, ids)
+        remaining //= 36
+    return ids
+
+
+class Hierarchy:
+    """Node table of a hierarchy, ordered level by level from the roots.
+
+    Arrays (one entry per node):
+    - ``ids``: unique "parent/label" ids, the same ids Plotly Express builds
+    - ``parents``: parent ids, "" for root nodes
+    - ``labels``, ``values``, ``depth`` (0 for roots)
+    - ``parent_index``: position of the parent node, -1 for roots
+
+    ``level_offsets[k]`` is the position of the first node at depth ``k`` and
+    ``row_leaf`` maps every input row to its leaf node. A parent -> children
+    index for drill-down is built the first time it's needed.
+
+    ``columns`` maps color column names to ``(reducer, total, weight)`` per
+    node; ``column(name)`` turns those into the values to plot.
+    """
+
+    def __init__(
+        self,
+        ids,
+        parents,
+        labels,
+        values,
+        depth,
+        parent_index,
+        level_offsets,
+        row_leaf,
+        path,
+        values_column=None,
+        columns=None,
+    ):
+        self.ids = ids
+        self.parents = parents
+        self.labels = labels
+        self.values = values
+        self.depth = depth
+        self.parent_index = parent_index
+        self.level_offsets = level_offsets
+        self.row_leaf = row_leaf
+        self.path = path
+        self.values_column = values_column
+        self.columns = columns if columns is not None else {}
+        self._positions = None
+        self._child_offsets = None
+        self._child_order = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def position(self, node_id):
+        """Index of the node with id ``node_id``."""
+        if self._positions is None:
+            self._positions = pd.Index(self.ids)
+        return self._positions.get_loc(node_id)
+
+    def children(self, nodes):
+        """Indices of all children of the given node indices."""
+        if self._child_offsets is None:
+            self._child_offsets, self._child_order = csr_index(self.parent_index, len(self))
+        return csr_gather(np.atleast_1d(nodes), self._child_offsets, self._child_order)
+
+    def subtree(self, root=None, maxdepth=3):
+        """Node indices for ``root`` plus its descendants, ``maxdepth`` levels in all.
+
+        ``root`` is a node id, or None for the top of the hierarchy.
+        """
+        if root is None:
+            frontier = np.arange(self.level_offsets[0], self.level_offsets[1])
+        else:
+            frontier = np.array([self.position(root)])
+        selected = [frontier]
+        for _ in range(maxdepth - 1):
+            frontier = self.children(frontier)
+            if len(frontier) == 0:
+                break
+            selected.append(frontier)
+        return np.concatenate(selected)
+
+    def subtree_trace(self, root=None, maxdepth=3, kind="sunburst", **trace_kwargs):
+        """Trace showing only ``subtree(root, maxdepth)``, with ``root`` at the center."""
+        nodes = self.subtree(root, maxdepth)
+        parents = self.parents[nodes]
+        if root is not None:
+            parents[0] = ""
+        arrays = dict(ids=self.ids[nodes], labels=self.labels[nodes], parents=parents, values=self.values[nodes])
+        return TRACE_TYPES[kind](**arrays, **{"branchvalues": "total", **trace_kwargs})
+
+    def parent_id(self, node_id):
+        """Parent id of ``node_id``, or None at the top of the hierarchy."""
+        return self.parents[self.position(node_id)] or None
+
+    @property
+    def n_levels(self):
+        return len(self.level_offsets) - 1
+
+    def level(self, depth):
+        """Slice selecting the nodes at ``depth``."""
+        return slice(self.level_offsets[depth], self.level_offsets[depth + 1])
+
+    def _roll_up(self, totals, ufunc=np.add):
+        # Combine every level into its parents, deepest level first
+        for depth in range(self.n_levels - 1, 0, -1):
+            level = self.level(depth)
+            ufunc.at(totals, self.parent_index[level], totals[level])
+        return totals
+
+    def add_column(self, df, column, reducer="weighted_mean", weights=None, name=None):
+        """Reduce ``df[column]`` onto every node and store it as ``name``.
+
+        ``df`` must be the DataFrame the hierarchy was built from (same row
+        order). ``weighted_mean`` weights rows by ``weights`` (default: the
+        values column, which is how Plotly Express colors parents).
+        """
+        self.columns[name or column] = self.reduce_column(df, column, reducer, weights)
+        return self.column(name or column)
+
+    def reduce_column(self, df, column, reducer="weighted_mean", weights=None):
+        """The ``(reducer, total, weight)`` entry ``add_column`` stores."""
+        if reducer not in REDUCERS:
+            raise ValueError(f"Unknown reducer {reducer!r}, expected one of {REDUCERS}")
+        n_nodes = len(self)
+        x = df[column].to_numpy(dtype=np.float64)
+
+        if reducer in EXTREMA:
+            ufunc, identity = EXTREMA[reducer]
+            total = np.full(n_nodes, identity)
+            ufunc.at(total, self.row_leaf, x)
+            return reducer, self._roll_up(total, ufunc), None
+
+        if reducer == "weighted_mean":
+            weights = weights or self.values_column
+            w = np.ones(len(x)) if weights is None else df[weights].to_numpy(dtype=np.float64)
+        else:
+            w = np.ones(len(x))
+        if reducer == "count":
+            x = np.ones(len(x))
+
+        total = self._roll_up(np.bincount(self.row_leaf, weights=x * w, minlength=n_nodes))
+        weight = None
+        if reducer in ("weighted_mean", "mean"):
+            weight = self._roll_up(np.bincount(self.row_leaf, weights=w, minlength=n_nodes))
+        return reducer, total, weight
+
+    def copy(self):
+        """Shallow copy with its own ``columns``; the node arrays are shared."""
+        other = copy.copy(self)
+        other.columns = dict(self.columns)
+        return other
+
+    def column(self, name):
+        """Per-node values of a color column added with ``add_column``."""
+        reducer, total, weight = self.columns[name]
+        if weight is None:
+            return total
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return total / weight
+
+    def overall(self, name):
+        """The column reduced over every row, e.g. a colorscale midpoint."""
+        reducer, total, weight = self.columns[name]
+        roots = self.level(0)
+        if reducer in EXTREMA:
+            return EXTREMA[reducer][0].reduce(total[roots])
+        return total[roots].sum() / (1 if weight is None else weight[roots].sum())
+
+    def trace_arrays(self):
+        """ids/labels/parents/values ready to pass to a hierarchical trace."""
+        return dict(ids=self.ids, labels=self.labels, parents=self.parents, values=self.values)
+
+    def trace_dict(self, kind="sunburst", color=None, customdata=None, compact=False, **trace_kwargs):
+        """Trace as a plain dict, which ``go.Figure`` validates only once.
+
+        ``color`` names a column from ``add_column`` used for
+        ``marker.colors``; ``customdata`` lists columns for hover templates.
+
+        ``compact=True`` shrinks the payload: values, colors and customdata
+        go out as integer or float32 typed arrays (see ``compact_array``).
+        ``compact="ids"`` also replaces the "parent/label" ids with short
+        base-36 positions; map a clicked id back with
+        ``hierarchy.ids[int(clicked, 36)]``.
+        """
+        if kind not in TRACE_TYPES:
+            raise ValueError(f"Unknown trace kind {kind!r}, expected one of {sorted(TRACE_TYPES)}")
+        encode = compact_array if compact else np.asarray
+        if color is not None:
+            trace_kwargs["marker"] = {
+                "colors": encode(self.column(color)),
+                "showscale": True,
+                **trace_kwargs.get("marker", {}),
+            }
+        if customdata is not None:
+            columns = np.column_stack([self.column(name) for name in customdata])
+            trace_kwargs["customdata"] = columns.astype(np.float32) if compact else columns
+
+        arrays = self.trace_arrays()
+        if compact:
+            arrays["values"] = compact_array(self.values)
+        if compact == "ids":
+            ids = short_ids(len(self))
+            arrays["ids"] = ids
+            has_parent = self.parent_index >= 0
+            arrays["parents"] = np.where(has_parent, ids[np.maximum(self.parent_index, 0)], "").astype(object)
+        return dict(type=kind, **arrays, **{"branchvalues": "total", **trace_kwargs})
+
+    def to_trace(self, kind="sunburst", color=None, customdata=None, compact=False, **trace_kwargs):
+        """Build a ``go.Sunburst``, ``go.Treemap`` or ``go.Icicle`` trace (see ``trace_dict``)."""
+        trace = self.trace_dict(kind, color, customdata, compact, **trace_kwargs)
+        return TRACE_TYPES[trace.pop("type")](**trace)
+
+    def to_figure(self, kind="sunburst", layout=None, **trace_kwargs):
+        return go.Figure(self.to_trace(kind, **trace_kwargs), layout=layout)
+
+    def views_figure(
+        self,
+        kinds=("sunburst", "treemap", "icicle"),
+        layout=None,
+        gap=0.02,
+        kind_kwargs=None,
+        **trace_kwargs,
+    ):
+        """One figure showing the hierarchy as several trace types side by side.
+
+        Every view shares this hierarchy's arrays, so each extra view only
+        costs building its trace. ``trace_kwargs`` apply to every view and
+        ``kind_kwargs`` maps a kind to extra keyword arguments for that view,
+        e.g. ``{"treemap": {"root_color": "lightgrey"}}``.
+        """
+        kind_kwargs = kind_kwargs or {}
+        width = (1 - gap * (len(kinds) - 1)) / len(kinds)
+        traces = []
+        for i, kind in enumerate(kinds):
+            domain = dict(x=[i * (width + gap), i * (width + gap) + width], y=[0, 1])
+            traces.append(self.trace_dict(kind, domain=domain, **{**trace_kwargs, **kind_kwargs.get(kind, {})}))
+        return go.Figure(data=traces, layout=layout)
+
+
+class Constant:
+    """A path level with the same label for every row, like ``px.Constant``."""
+
+    def __init__(self, label):
+        self.label = str(label)
+
+    def __repr__(self):
+        return f"Constant({self.label!r})"
+
+
+def _level_codes(df, level, n_rows):
+    # Integer codes and labels for one path level (a column name or a constant)
+    if isinstance(level, Constant):
+        return np.zeros(n_rows, dtype=np.int64), np.array([level.label], dtype=object)
+    column = df[level]
+    if column.isna().any():
+        raise ValueError(f"Path column {level!r} contains missing values")
+    codes, labels = pd.factorize(column, sort=False)
+    return codes.astype(np.int64), np.asarray(labels.astype(str), dtype=object)
+
+
+def compute_hierarchy(df, path, values=None):
+    """Build a ``Hierarchy`` from ``df`` without caching.
+
+    ``path`` lists column names (or ``Constant`` levels) from the root down;
+    ``values`` names the column summed into each node, or counts rows if None.
+    """
+    if not path:
+        raise ValueError("path needs at least one level")
+    n_rows = len(df)
+    weights = None if values is None else df[values].to_numpy(dtype=np.float64)
+
+    # Top-down: nodes at each level are unique (parent node, label) pairs
+    level_ids, level_labels, level_parents, level_inverse = [], [], [], []
+    parent_codes = np.zeros(n_rows, dtype=np.int64)
+    parent_ids = np.array([""], dtype=object)
+    for depth, level in enumerate(path):
+        codes, labels = _level_codes(df, level, n_rows)
+        keys = parent_codes * len(labels) + codes
+        inverse, unique_keys = pd.factorize(keys, sort=False)
+        node_parent, node_label = np.divmod(unique_keys, len(labels))
+
+        node_labels = labels[node_label]
+        node_ids = node_labels if depth == 0 else parent_ids[node_parent] + "/" + node_labels
+
+        level_ids.append(node_ids)
+        level_labels.append(node_labels)
+        level_parents.append(node_parent)
+        level_inverse.append(inverse)
+        parent_codes, parent_ids = inverse.astype(np.int64), node_ids
+
+    # Bottom-up: sum leaf values, then roll each level into its parents
+    sizes = [len(ids) for ids in level_ids]
+    level_values = [None] * len(path)
+    level_values[-1] = np.bincount(level_inverse[-1], weights=weights, minlength=sizes[-1]).astype(np.float64)
+    for depth in range(len(path) - 1, 0, -1):
+        level_values[depth - 1] = np.bincount(
+            level_parents[depth], weights=level_values[depth], minlength=sizes[depth - 1]
+        )
+
+    # Concatenate levels; parent positions shift by the start of the level above
+    level_offsets = np.concatenate([[0], np.cumsum(sizes)])
+    parent_index = np.concatenate(
+        [np.full(sizes[0], -1, dtype=np.int64)]
+        + [level_parents[depth] + level_offsets[depth - 1] for depth in range(1, len(path))]
+    )
+    ids = np.concatenate(level_ids)
+    parents = np.where(parent_index >= 0, ids[np.maximum(parent_index, 0)], "").astype(object)
+
+    return Hierarchy(
+        ids=ids,
+        parents=parents,
+        labels=np.concatenate(level_labels),
+        values=np.concatenate(level_values),
+        depth=np.repeat(np.arange(len(path)), sizes),
+        parent_index=parent_index,
+        level_offsets=level_offsets,
+        row_leaf=level_inverse[-1] + level_offsets[-2],
+        path=list(path),
+        values_column=values,
+    )
+
+
+def keep_top_children(hierarchy, top_n, other_label="Other"):
+    """Keep the ``top_n`` largest children of every node; merge the rest.
+
+    ``top_n`` is an int, or a list with one entry per depth (None keeps every
+    node at that depth). The children dropped under a parent (and their
+    subtrees) become a single "Other" leaf holding their total, so parent
+    values are unchanged. Ranking is one lexsort over all nodes.
+    """
+    h = hierarchy
+    n_nodes = len(h)
+    limits = [top_n] * h.n_levels if np.isscalar(top_n) else list(top_n) + [None] * (h.n_levels - len(top_n))
+    limit = np.array([np.inf if n is None else n for n in limits], dtype=np.float64)[h.depth]
+
+    # Rank siblings by value (largest first); roots are siblings of each other
+    rank = sibling_rank(h.parent_index, h.values)
+
+    # A node survives if it ranks within the limit and its parent survives
+    collapsed = rank >= limit
+    kept = ~collapsed
+    for depth in range(1, h.n_levels):
+        level = h.level(depth)
+        kept[level] &= kept[h.parent_index[level]]
+
+    # One "Other" node per surviving parent that lost children (-1 = roots)
+    merged = collapsed & ((h.parent_index < 0) | kept[np.maximum(h.parent_index, 0)])
+    other_parents, other_of_node = np.unique(h.parent_index[merged], return_inverse=True)
+    other_values = np.bincount(other_of_node, weights=h.values[merged], minlength=len(other_parents))
+    other_depth = np.where(other_parents < 0, 0, h.depth[np.maximum(other_parents, 0)] + 1)
+    other_ids = np.where(other_parents < 0, "", h.ids[np.maximum(other_parents, 0)] + "/").astype(object) + "__other__"
+
+    # New node order: kept nodes and Other nodes, level by level
+    kept_nodes = np.flatnonzero(kept)
+    depth = np.concatenate([h.depth[kept_nodes], other_depth])
+    order = np.argsort(depth, kind="stable")
+    new_position = np.empty(len(order), dtype=np.int64)
+    new_position[order] = np.arange(len(order))
+
+    # Where every old node ends up: itself, its parent's Other node, or
+    # (for nodes under a merged ancestor) wherever that ancestor went
+    replacement = np.full(n_nodes, -1, dtype=np.int64)
+    replacement[kept_nodes] = new_position[: len(kept_nodes)]
+    replacement[merged] = new_position[len(kept_nodes) + other_of_node]
+    for depth_level in range(1, h.n_levels):
+        level = np.arange(h.level_offsets[depth_level], h.level_offsets[depth_level + 1])
+        missing = level[replacement[level] < 0]
+        replacement[missing] = replacement[h.parent_index[missing]]
+
+    # Color columns: Other nodes combine the totals of the nodes they replace
+    columns = {}
+    for name, (reducer, total, weight) in h.columns.items():
+        ufunc, identity = EXTREMA.get(reducer, (np.add, 0.0))
+        other_total = np.full(len(other_parents), identity)
+        ufunc.at(other_total, other_of_node, total[merged])
+        if weight is not None:
+            other_weight = np.bincount(other_of_node, weights=weight[merged], minlength=len(other_parents))
+            weight = np.concatenate([weight[kept_nodes], other_weight])[order]
+        columns[name] = (reducer, np.concatenate([total[kept_nodes], other_total])[order], weight)
+
+    old_parent = np.concatenate([h.parent_index[kept_nodes], other_parents])
+    parent_index = np.where(old_parent < 0, -1, replacement[np.maximum(old_parent, 0)])[order]
+    ids = np.concatenate([h.ids[kept_nodes], other_ids])[order]
+    depth = depth[order]
+
+    return Hierarchy(
+        ids=ids,
+        parents=np.where(parent_index >= 0, ids[np.maximum(parent_index, 0)], "").astype(object),
+        labels=np.concatenate([h.labels[kept_nodes], np.full(len(other_ids), other_label, dtype=object)])[order],
+        values=np.concatenate([h.values[kept_nodes], other_values])[order],
+        depth=depth,
+        parent_index=parent_index,
+        level_offsets=np.searchsorted(depth, np.arange(h.n_levels + 1)),
+        row_leaf=replacement[h.row_leaf],
+        path=h.path,
+        values_column=h.values_column,
+        columns=columns,
+    )
+
+
+def _first_rows(codes, n_codes):
+    # Position of the first row carrying each code
+    first = np.empty(n_codes, dtype=np.int64)
+    rows = np.arange(len(codes))
+    first[codes[::-1]] = rows[::-1]
+    return first
+
+
+def normalize_hierarchy(labels, parents, values=None, ids=None, errors="raise"):
+    """Validate raw ``labels``/``parents`` lists and build a ``Hierarchy``.
+
+    This is the input ``go.Sunburst``/``go.Treemap``/``go.Icicle`` take
+    directly, where a parent that doesn't exist, a duplicated label or a
+    cycle makes Plotly drop nodes without saying which. Parents refer to
+    ``ids`` (the labels when ``ids`` is None); a duplicated id resolves to
+    its first row. Nodes are keyed on the id, so rows with different ids
+    keep their own node even under the same label, and node ids are the
+    "parent/id" path. Only rows repeating an id under the same parent are
+    merged into one node, and those are reported as ``duplicates``.
+
+    ``values`` are each row's own value; parents get the sum of their
+    subtree bottom-up, ready for ``branchvalues="total"``. Without
+    ``values`` every leaf counts 1.
+
+    ``errors`` says what to do with orphans (parent not found) and cycles:
+    ``"raise"`` a ValueError, ``"drop"`` them and their descendants, or
+    (orphans only) move them to the top level with ``"root"``. Returns
+    ``(hierarchy, report)``; the report holds input row positions of
+    ``orphans``, their ``descendants``, rows in or under ``cycles`` and
+    ``duplicates``, plus a ``kept`` mask. ``hierarchy.row_leaf`` maps the
+    kept rows, in input order, to their node.
+
+    Every step is a hash lookup or a linear pass, so this is O(n) apart from
+    one stable argsort grouping rows by parent.
+    """
+    if errors not in ("raise", "drop", "root"):
+        raise ValueError(f"errors must be 'raise', 'drop' or 'root', got {errors!r}")
+    labels = np.asarray(labels, dtype=object).astype(str).astype(object)
+    n_rows = len(labels)
+    keys = labels if ids is None else np.asarray(ids, dtype=object).astype(str).astype(object)
+    parents = pd.Series(parents, dtype=object)
+    if len(parents) != n_rows or len(keys) != n_rows:
+        raise ValueError("labels, parents and ids must have the same length")
+
+    # Dict-style lookups: every parent resolves to the first row with that id
+    key_codes, unique_keys = pd.factorize(keys)
+    first_row = _first_rows(key_codes, len(unique_keys))
+    is_root = parents.isna().to_numpy() | (parents == "").to_numpy()
+    parent_codes = pd.Index(unique_keys).get_indexer(parents.astype(str))
+    parent_row = np.where(parent_codes >= 0, first_row[parent_codes], -1)
+    parent_row[is_root] = -1
+    orphans = np.flatnonzero(~is_root & (parent_codes < 0))
+    duplicates = np.flatnonzero(first_row[key_codes] != np.arange(n_rows))
+
+    offsets, order = csr_index(parent_row, n_rows)
+    if errors == "root":
+        is_root[orphans] = True
+
+    # Walk down from the roots level by level; nodes are unique parent/id paths
+    row_node = np.full(n_rows, -1, dtype=np.int64)
+    level_ids, level_labels, level_parents = [], [], []
+    frontier = np.flatnonzero(is_root)
+    parent_start = level_start = 0
+    unique_keys = np.asarray(unique_keys, dtype=object)
+    n_keys = len(unique_keys)
+    while len(frontier):
+        # Same int64 (parent node, code) key as compute_hierarchy; roots get parent -1
+        local_parent = row_node[parent_row[frontier]] - parent_start if level_ids else -1
+        inverse, node_keys = pd.factorize(local_parent * n_keys + key_codes[frontier])
+        node_parent, node_key = np.divmod(node_keys, n_keys)
+        node_names = unique_keys[node_key]
+        row_node[frontier] = level_start + inverse
+
+        if level_ids:
+            level_ids.append(level_ids[-1][node_parent] + "/" + node_names)
+            level_parents.append(node_parent + parent_start)
+        else:
+            level_ids.append(node_names)
+            level_parents.append(node_parent)
+        # A merged node shows the label of its first row
+        level_labels.append(labels[frontier[_first_rows(inverse, len(node_keys))]])
+        parent_start, level_start = level_start, level_start + len(node_keys)
+        frontier = csr_gather(frontier, offsets, order)
+
+    # Rows never reached hang off an orphan or sit in (or under) a cycle
+    kept = row_node >= 0
+    descendants = np.zeros(n_rows, dtype=bool)
+    frontier = orphans if errors != "root" else orphans[:0]
+    while len(frontier):
+        frontier = csr_gather(frontier, offsets, order)
+        descendants[frontier] = True
+    cycles = np.flatnonzero(~kept & ~descendants)
+    cycles = cycles[~np.isin(cycles, orphans)]
+    descendants = np.flatnonzero(descendants)
+    report = dict(orphans=orphans, descendants=descendants, cycles=cycles, duplicates=duplicates, kept=kept)
+
+    if errors == "raise" and not kept.all():
+        raise ValueError(
+            f"{len(orphans)} orphans (e.g. {labels[orphans[:5]].tolist()} with missing parents "
+            f"{parents.to_numpy()[orphans[:5]].tolist()}), {len(descendants)} rows under them and "
+            f"{len(cycles)} rows in or under cycles (e.g. {labels[cycles[:5]].tolist()})"
+        )
+    if not level_ids:
+        raise ValueError("No root rows: every row has a parent")
+
+    # Bottom-up: each node's own value plus everything below it
+    sizes = [len(level) for level in level_ids]
+    level_offsets = np.concatenate([[0], np.cumsum(sizes)])
+    parent_index = np.concatenate(level_parents)
+    row_leaf = row_node[kept]
+    if values is None:
+        own = (np.bincount(parent_index[parent_index >= 0], minlength=level_offsets[-1]) == 0)[row_leaf]
+    else:
+        own = np.asarray(values, dtype=np.float64)[kept]
+    ids = np.concatenate(level_ids)
+    hierarchy = Hierarchy(
+        ids=ids,
+        parents=np.where(parent_index >= 0, ids[np.maximum(parent_index, 0)], "").astype(object),
+        labels=np.concatenate(level_labels),
+        values=None,
+        depth=np.repeat(np.arange(len(sizes)), sizes),
+        parent_index=parent_index,
+        level_offsets=level_offsets,
+        row_leaf=row_leaf,
+        path=None,
+    )
+    hierarchy.values = hierarchy._roll_up(np.bincount(row_leaf, weights=own, minlength=len(ids)).astype(np.float64))
+    return hierarchy, report
+
+
+class HierarchyCache(ContentCache):
+    """Hierarchies keyed on (hash of the path and values columns, path, values).
+
+    Only the columns the hierarchy is built from are hashed, so adding or
+    editing other columns keeps the cached grouping. Color reductions are
+    cached next to their hierarchy, keyed on the color column's own hash.
+    Holds at most ``max_entries`` hierarchies and reductions in all.
+    """
+
+    def __init__(self, max_entries=32):
+        super().__init__(max_entries)
+
+    def _key(self, df, path, values, key):
+        columns = [level for level in path if not isinstance(level, Constant)]
+        columns += [] if values is None else [values]
+        return key or frame_hash(df, columns), tuple(map(repr, path)), values
+
+    def get(self, df, path, values=None, key=None):
+        return self.lookup(self._key(df, path, values, key), lambda: compute_hierarchy(df, path, values))
+
+    def colored(self, df, path, values=None, color=None, key=None):
+        """``get`` plus the reductions in ``color`` ({column: reducer}).
+
+        Returns a copy of the cached hierarchy holding just those columns;
+        the cached one is never modified.
+        """
+        hierarchy_key = self._key(df, path, values, key)
+        hierarchy = self.lookup(hierarchy_key, lambda: compute_hierarchy(df, path, values)).copy()
+        for column, reducer in (color or {}).items():
+            column_key = (hierarchy_key, column, reducer, key or column_hash(df[column]))
+            hierarchy.columns[column] = self.lookup(
+                column_key, lambda: hierarchy.reduce_column(df, column, reducer)
+            )
+        return hierarchy
+
+
+# Shared by every build_hierarchy call that doesn't pass its own cache
+default_cache = HierarchyCache()
+
+
+def build_hierarchy(df, path, values=None, color=None, top_n=None, other_label="Other", cache=None, key=None):
+    """Cached ``compute_hierarchy``: repeat calls on the same data are free.
+
+    ``color`` maps columns to reducers (or lists columns to weighted-average)
+    and adds them as with ``add_column``; each reduction is cached on a hash
+    of its column, so editing that column recomputes it. ``top_n`` keeps only the largest children per node
+    (see ``keep_top_children``); the full hierarchy stays cached, so changing
+    ``top_n`` doesn't regroup the data. Pass ``cache=False`` to skip caching,
+    or ``key`` to identify the data yourself instead of hashing it.
+    """
+    if color is not None and not isinstance(color, dict):
+        color = {column: "weighted_mean" for column in color}
+    if cache is False:
+        hierarchy = compute_hierarchy(df, path, values)
+        for column, reducer in (color or {}).items():
+            hierarchy.add_column(df, column, reducer)
+    else:
+        cache = cache if cache is not None else default_cache
+        hierarchy = cache.colored(df, path, values, color, key=key)
+    return hierarchy if top_n is None else keep_top_children(hierarchy, top_n, other_label)
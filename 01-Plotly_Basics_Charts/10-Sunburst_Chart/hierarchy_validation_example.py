@@ -0,0 +1,93 @@
+# %%
+"""
+Validating Raw labels/parents Hierarchies
+=========================================
+
+icicle_chart_advanced.py and Treemap_Chart-v2.py pass labels and parents
+lists straight to Plotly. If a parent is misspelled, a label appears twice
+or two nodes point at each other, the browser quietly leaves those nodes
+out and nothing tells you which ones went missing.
+
+normalize_hierarchy() checks the lists in Python before rendering. It
+reports orphans, cycles and duplicates, generates unique ids and computes
+branchvalues="total" sums from the bottom up.
+"""
+
+import time
+
+import numpy as np
+
+from hierarchy_engine import normalize_hierarchy
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: the file system from icicle_chart_advanced.py
+# ==============================================================================
+labels = ["Root", "Folder A", "Folder B", "File 1", "File 2", "Subfolder A", "File 3", "File 4"]
+parents = ["", "Root", "Root", "Folder A", "Folder A", "Folder B", "Subfolder A", "Folder B"]
+sizes = [0, 0, 0, 120, 80, 0, 300, 50]  # only files have a size of their own
+
+hierarchy, report = normalize_hierarchy(labels, parents, values=sizes)
+for node_id, value in zip(hierarchy.ids, hierarchy.values):
+    print(f"{node_id:<35} {value:>6.0f}")
+
+fig = hierarchy.to_figure(
+    "icicle",
+    root_color="lightgrey",
+    layout=dict(title="File System Hierarchy", margin=dict(t=50, l=25, r=25, b=25)),
+)
+fig.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 2: a family tree with mistakes in it
+# ==============================================================================
+# Same tree as Treemap_Chart-v2.py, plus a typo ("Set"), a repeated name
+# and two rows pointing at each other
+names = ["Eve", "Cain", "Seth", "Enos", "Noam", "Abel", "Awan", "Enoch", "Azura", "Irad", "Cain", "Lamech", "Adah"]
+parents = ["", "Eve", "Eve", "Seth", "Set", "Eve", "Eve", "Awan", "Eve", "Enoch", "Eve", "Adah", "Lamech"]
+
+try:
+    normalize_hierarchy(names, parents)
+except ValueError as error:
+    print(f"Rejected: {error}")
+
+hierarchy, report = normalize_hierarchy(names, parents, errors="drop")
+names = np.array(names)
+print("Orphans:    ", names[report["orphans"]].tolist())
+print("Cycles:     ", names[report["cycles"]].tolist())
+print("Duplicates: ", names[report["duplicates"]].tolist(), "(merged into the first row)")
+print(f"Kept {report['kept'].sum()} of {len(names)} rows as {len(hierarchy)} nodes")
+
+fig = hierarchy.to_figure("treemap", root_color="lightgrey", layout=dict(title="Family Tree (validated)"))
+fig.show()
+
+# With ids, two people sharing a name under one parent stay two nodes
+hierarchy, report = normalize_hierarchy(
+    ["Boss", "John", "John", "A", "B"],
+    ["", "b", "b", "j1", "j2"],
+    values=[1, 2, 3, 4, 5],
+    ids=["b", "j1", "j2", "a", "bb"],
+)
+assert hierarchy.ids.tolist() == ["b", "b/j1", "b/j2", "b/j1/a", "b/j2/bb"]
+assert hierarchy.values.tolist() == [15, 6, 8, 4, 5] and len(report["duplicates"]) == 0
+
+# %%
+# ==============================================================================
+# BENCHMARK: one million nodes in a random tree
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_nodes = 1_000_000
+# Every node after the first picks an earlier node as its parent
+parent_position = np.r_[-1, rng.integers(0, np.arange(1, n_nodes))]
+labels = np.array([f"node {i}" for i in range(n_nodes)], dtype=object)
+parents = np.where(parent_position < 0, "", labels[np.maximum(parent_position, 0)])
+# Break a few links to show the report at scale
+parents[rng.choice(n_nodes, 10, replace=False)] = "missing"
+
+start = time.perf_counter()
+hierarchy, report = normalize_hierarchy(labels, parents, errors="drop")
+elapsed = time.perf_counter() - start
+
+print(f"Normalized {n_nodes:,} rows in {elapsed:.2f}s: {len(hierarchy):,} nodes, {hierarchy.n_levels} levels")
+print(f"{len(report['orphans'])} orphans dropped with {len(report['descendants']):,} rows below them")
@@ -0,0 +1,72 @@
+# %%
+"""
+One Hierarchy, Three Views
+==========================
+
+Dashboards often show the same data as a sunburst (sunburst.py), a treemap
+(Treemap_Chart.py) and an icicle (icicle_chart_colored.py) side by side.
+Three Plotly Express calls regroup the data three times. A cached Hierarchy
+groups it once; views_figure() then places all three trace types in one
+figure, built from the same ids/parents/values arrays.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from hierarchy_engine import Constant, build_hierarchy
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: the tips treemap from Treemap_Chart.py, as all three views
+# ==============================================================================
+df_tips = px.data.tips()
+tips = build_hierarchy(df_tips, [Constant("all"), "day", "time", "sex"], values="total_bill", color=["tip"])
+
+fig = tips.views_figure(
+    color="tip",
+    marker=dict(colorscale="Blues"),
+    kind_kwargs={"treemap": dict(root_color="lightgrey"), "icicle": dict(root_color="lightgrey")},
+    hovertemplate="<b>%{label}</b><br>Total bill: $%{value:,.2f}<br>Average tip: $%{color:.2f}<extra></extra>",
+    layout=dict(title="Tips by day, time and sex", height=550, margin=dict(t=50, l=10, r=10, b=10)),
+)
+fig.show()
+
+# %%
+# ==============================================================================
+# BENCHMARK: three px figures vs one cached hierarchy with three views
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_rows = 100_000
+df_large = pd.DataFrame(
+    {
+        "Region": rng.choice(["North America", "Europe", "Asia", "South America", "Africa"], n_rows),
+        "Country": "Country " + rng.integers(0, 40, n_rows).astype(str),
+        "Product": "Product " + rng.integers(0, 200, n_rows).astype(str),
+        "Sales": rng.gamma(2.0, 500.0, n_rows),
+    }
+)
+path = ["Region", "Country", "Product"]
+
+start = time.perf_counter()
+for chart in [px.sunburst, px.treemap, px.icicle]:
+    chart(df_large, path=path, values="Sales")
+px_time = time.perf_counter() - start
+
+start = time.perf_counter()
+hierarchy = build_hierarchy(df_large, path, values="Sales")
+fig = hierarchy.views_figure(layout=dict(title="Sales: sunburst, treemap and icicle", height=550))
+engine_time = time.perf_counter() - start
+
+# A second dashboard refresh finds the hierarchy in the cache
+start = time.perf_counter()
+build_hierarchy(df_large, path, values="Sales").views_figure()
+refresh_time = time.perf_counter() - start
+
+print(f"Nodes per view: {len(hierarchy):,}")
+print(f"px.sunburst + px.treemap + px.icicle: {px_time:.2f}s")
+print(f"One hierarchy, three views:           {engine_time:.2f}s")
+print(f"Cached refresh, three views:          {refresh_time:.2f}s")
+fig.show()
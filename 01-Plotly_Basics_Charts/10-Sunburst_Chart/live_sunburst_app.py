@@ -0,0 +1,113 @@
+# %%
+"""
+Dash App: Live Sales Sunburst with Incremental Updates
+======================================================
+
+Every two seconds a batch of new sales arrives and a few old ones are
+refunded. Instead of regrouping the whole history with px.sunburst, the app
+applies the batch to an IncrementalHierarchy and sends a dash.Patch holding
+only the sectors whose values changed.
+
+The hierarchy and the refund cursor live in the server process, so the
+totals stay right however many tabs are open, but each tab only patches in
+the changes from its own refreshes (reload to catch up). Run the file and
+open http://127.0.0.1:8050 to try the app.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+from dash import Dash, Input, Output, Patch, dcc, html
+
+from hierarchy_engine import Constant
+from incremental_hierarchy import IncrementalHierarchy, patch
+
+rng = np.random.default_rng(42)
+regions = ["North", "South", "East", "West"]
+categories = ["Electronics", "Furniture", "Clothing", "Groceries", "Toys"]
+path = [Constant("All Sales"), "Region", "Store", "Category", "Product"]
+
+
+def sales_batch(n_rows):
+    return pd.DataFrame(
+        {
+            "Region": rng.choice(regions, n_rows),
+            "Store": "Store " + rng.integers(0, 50, n_rows).astype(str),
+            "Category": rng.choice(categories, n_rows),
+            "Product": "Product " + rng.integers(0, 40, n_rows).astype(str),
+            "Sales": rng.gamma(2.0, 50.0, n_rows).round(2),
+        }
+    )
+
+
+# %%
+# ==============================================================================
+# DATA: a large sales history, then small batches of new sales and refunds
+# ==============================================================================
+history = sales_batch(300_000)
+start = time.perf_counter()
+live = IncrementalHierarchy(path, values="Sales", df=history)
+print(f"Initial hierarchy: {len(live):,} nodes in {time.perf_counter() - start:.2f}s")
+
+# One refresh, the old way: regroup everything
+new_rows, refunds = sales_batch(500), history.iloc[:50]
+start = time.perf_counter()
+px.sunburst(pd.concat([history, new_rows]), path=["Region", "Store", "Category", "Product"], values="Sales")
+print(f"px.sunburst on the full history:  {time.perf_counter() - start:.2f}s")
+
+# The same refresh as a delta
+start = time.perf_counter()
+update = live.append(new_rows)
+refund_update = live.retract(refunds)
+print(f"Incremental append + retract:     {time.perf_counter() - start:.4f}s")
+print(f"Changed nodes sent: {len(update['positions']) + len(refund_update['positions'])} of {len(live):,}")
+
+# %%
+# ==============================================================================
+# DASH APP
+# ==============================================================================
+app = Dash(__name__)
+lock = threading.Lock()
+# Next history row to refund. It belongs to the server, not to a tab:
+# n_intervals restarts at 0 on every page load and would refund rows twice
+next_refund = len(refunds)
+
+
+def live_figure():
+    return live.to_figure(
+        hovertemplate="<b>%{label}</b><br>Sales: $%{value:,.0f}<extra></extra>",
+        maxdepth=3,
+        layout=dict(title="Live sales", height=750, margin=dict(t=60, l=10, r=10, b=10), uirevision="live"),
+    )
+
+
+# A function, so reloading the page starts from the current totals
+app.layout = lambda: html.Div(
+    [
+        dcc.Interval(id="live-interval", interval=2000),
+        dcc.Graph(id="live-sunburst", figure=live_figure()),
+    ]
+)
+
+
+@app.callback(
+    Output("live-sunburst", "figure"),
+    Input("live-interval", "n_intervals"),
+    prevent_initial_call=True,
+)
+def refresh(n_intervals):
+    global next_refund
+    figure = Patch()
+    with lock:
+        patch(figure, live.append(sales_batch(200)))
+        # Refund each historical sale at most once
+        patch(figure, live.retract(history.iloc[next_refund : next_refund + 20]))
+        next_refund += 20
+    return figure
+
+
+if __name__ == "__main__":
+    app.run(debug=True)
@@ -0,0 +1,125 @@
+# %%
+"""
+Weighted Colors on a Precomputed Hierarchy
+==========================================
+
+px.sunburst and px.treemap color parent nodes with the average of their
+children weighted by the values column. That means another groupby for
+every color column, and regrouping the whole dataset whenever the color
+changes.
+
+Hierarchy.add_column() reduces a column onto every node from the same
+row -> leaf mapping used for the sizes. Switching to another color column
+only costs one bincount per level.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from hierarchy_engine import Constant, build_hierarchy
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: the Profit Margin sunburst from sunburst.py
+# ==============================================================================
+df_custom = pd.DataFrame(
+    {
+        "Category": ["Electronics"] * 6 + ["Furniture"] * 4 + ["Clothing"] * 5,
+        "Subcategory": ["Laptops", "Smartphones", "Tablets", "Wearables", "Accessories", "Monitors",
+                        "Chairs", "Tables", "Desks", "Bookcases",
+                        "Shirts", "Pants", "Dresses", "Shoes", "Accessories"],
+        "Sales": [25000, 32000, 12000, 8000, 5000, 7000, 12000, 10000, 8000, 6000,
+                  15000, 12000, 10000, 18000, 6000],
+        "Profit Margin": [0.25, 0.35, 0.20, 0.40, 0.50, 0.15, 0.20, 0.25, 0.15, 0.10,
+                          0.30, 0.25, 0.35, 0.15, 0.45],
+    }
+)
+df_custom["Profit"] = df_custom["Sales"] * df_custom["Profit Margin"]
+
+# Profit Margin is averaged weighted by Sales (like px); Profit is summed,
+# so parents show their real total instead of px's "(?)"
+hierarchy = build_hierarchy(
+    df_custom,
+    ["Category", "Subcategory"],
+    values="Sales",
+    color={"Profit Margin": "weighted_mean", "Profit": "sum"},
+)
+fig = hierarchy.to_figure(
+    "sunburst",
+    color="Profit Margin",
+    customdata=["Profit"],
+    marker=dict(colorscale="Viridis", colorbar=dict(title="Profit Margin", tickformat=".0%")),
+    textinfo="label+percent parent+value",
+    hovertemplate="<b>%{label}</b><br>Sales: $%{value:,.0f}<br>Profit: $%{customdata[0]:,.0f}"
+    "<br>Profit Margin: %{color:.1%}<extra></extra>",
+    insidetextorientation="radial",
+    layout=dict(title="Product Categories by Sales (with Profit Margin)", height=700, width=800),
+)
+fig.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 2: life expectancy weighted by population, checked against px
+# ==============================================================================
+df_2007 = px.data.gapminder().query("year == 2007")
+path = [Constant("world"), "continent", "country"]
+
+world = build_hierarchy(df_2007, path, values="pop", color=["lifeExp"])
+midpoint = world.overall("lifeExp")
+
+fig_px = px.treemap(df_2007, path=[px.Constant("world"), "continent", "country"], values="pop", color="lifeExp")
+px_colors = dict(zip(fig_px.data[0].ids, fig_px.data[0].marker.colors))
+assert np.allclose([px_colors[node] for node in world.ids], world.column("lifeExp"))
+print(f"Colors match px.treemap; population-weighted life expectancy: {midpoint:.2f}")
+
+fig = world.to_figure(
+    "treemap",
+    color="lifeExp",
+    marker=dict(colorscale="RdBu", cmid=midpoint),
+    layout=dict(margin=dict(t=50, l=25, r=25, b=25)),
+)
+fig.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 3: recoloring a large hierarchy without regrouping
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_rows = 100_000
+df_large = pd.DataFrame(
+    {
+        "Division": rng.choice([f"Division {i}" for i in range(10)], n_rows),
+        "Department": rng.choice([f"Department {i}" for i in range(50)], n_rows),
+        "Team": rng.choice([f"Team {i}" for i in range(100)], n_rows),
+        "Headcount": rng.integers(1, 20, n_rows),
+        "Satisfaction": rng.uniform(1, 5, n_rows),
+        "Attrition": rng.uniform(0, 0.3, n_rows),
+    }
+)
+path = ["Division", "Department", "Team"]
+
+start = time.perf_counter()
+px.sunburst(df_large, path=path, values="Headcount", color="Satisfaction")
+print(f"px.sunburst with color:      {time.perf_counter() - start:.2f}s")
+
+start = time.perf_counter()
+large = build_hierarchy(df_large, path, values="Headcount", color=["Satisfaction"])
+large.to_figure(color="Satisfaction")
+print(f"Engine with color:           {time.perf_counter() - start:.2f}s")
+
+# The grouping is cached, so a new color column is just one more reduction
+start = time.perf_counter()
+large = build_hierarchy(df_large, path, values="Headcount", color={"Attrition": "max"})
+fig = large.to_figure(color="Attrition", marker=dict(colorscale="Reds"), layout=dict(title="Worst team attrition"))
+print(f"Engine, recolor by another:  {time.perf_counter() - start:.2f}s")
+fig.show()
+
+# Editing a color column invalidates just that reduction; the cached
+# hierarchies themselves are never modified
+df_large["Attrition"] *= 2
+doubled = build_hierarchy(df_large, path, values="Headcount", color={"Attrition": "max"})
+assert np.allclose(doubled.column("Attrition"), 2 * large.column("Attrition"))
+assert "Attrition" not in build_hierarchy(df_large, path, values="Headcount").columns
@@ -0,0 +1,97 @@
+# %%
+"""
+Dash App: Lazy Drill-Down on a Very Large Sunburst
+==================================================
+
+Sending every node of a very large hierarchy to the browser isn't
+feasible. This app builds the hierarchy once with hierarchy_engine.py and
+only sends the current root plus MAXDEPTH levels. Clicking a sector asks
+the server for that node's subtree; clicking the center goes back up.
+
+Run the file and open http://127.0.0.1:8050 to try the app.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from dash import Dash, Input, Output, State, dcc, html
+
+from hierarchy_engine import Constant, build_hierarchy
+
+MAXDEPTH = 3
+
+# %%
+# ==============================================================================
+# DATA: ~700k nodes (Region > Store > Category > Product)
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_rows = 1_200_000
+df_sales = pd.DataFrame(
+    {
+        "Region": rng.integers(0, 10, n_rows),
+        "Store": rng.integers(0, 40, n_rows),
+        "Category": rng.integers(0, 25, n_rows),
+        "Product": rng.integers(0, 100, n_rows),
+        "Sales": rng.gamma(2.0, 50.0, n_rows),
+    }
+)
+for column in ["Region", "Store", "Category", "Product"]:
+    df_sales[column] = column + " " + df_sales[column].astype(str)
+
+start = time.perf_counter()
+hierarchy = build_hierarchy(df_sales, [Constant("All Sales"), "Region", "Store", "Category", "Product"], values="Sales")
+print(f"Built {len(hierarchy):,} nodes in {time.perf_counter() - start:.2f}s")
+
+
+# %%
+# ==============================================================================
+# PAYLOAD: one drill-down level vs the whole tree
+# ==============================================================================
+def drilldown_figure(root=None):
+    trace = hierarchy.subtree_trace(
+        root,
+        maxdepth=MAXDEPTH,
+        hovertemplate="<b>%{label}</b><br>Sales: $%{value:,.0f}<extra></extra>",
+    )
+    fig = go.Figure(trace)
+    fig.update_layout(title=f"Sales drill-down: {root or 'All Sales'}", height=750, margin=dict(t=60, l=10, r=10, b=10))
+    return fig
+
+
+top = drilldown_figure()
+print(f"Top-level payload: {len(top.data[0].ids):,} nodes, {len(top.to_json()) / 1e3:,.0f} KB")
+store = drilldown_figure("All Sales/Region 3/Store 7")
+print(f"Store payload:     {len(store.data[0].ids):,} nodes, {len(store.to_json()) / 1e3:,.0f} KB")
+print(f"Whole tree:        {len(hierarchy):,} nodes")
+
+# %%
+# ==============================================================================
+# DASH APP
+# ==============================================================================
+app = Dash(__name__)
+app.layout = html.Div(
+    [
+        dcc.Store(id="drilldown-root", data=None),
+        dcc.Graph(id="drilldown-sunburst", figure=top),
+    ]
+)
+
+
+@app.callback(
+    Output("drilldown-sunburst", "figure"),
+    Output("drilldown-root", "data"),
+    Input("drilldown-sunburst", "clickData"),
+    State("drilldown-root", "data"),
+    prevent_initial_call=True,
+)
+def drill(click_data, root):
+    clicked = click_data["points"][0]["id"]
+    # Clicking the center goes up one level, anything else drills down
+    root = hierarchy.parent_id(clicked) if clicked == root else clicked
+    return drilldown_figure(root), root
+
+
+if __name__ == "__main__":
+    app.run(debug=True)
@@ -0,0 +1,68 @@
+# %%
+"""
+Top-N Children with an "Other" Slice
+====================================
+
+The business dashboard in sunburst.py has a handful of categories per
+department. Real project data has thousands of projects per department,
+which makes the chart unreadable and slow. keep_top_children() keeps the
+N largest children of every node and merges the rest into one "Other"
+slice per parent, without changing any parent totals.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from hierarchy_engine import build_hierarchy
+
+# %%
+# ==============================================================================
+# DATA: thousands of projects per department, with a few large ones
+# ==============================================================================
+rng = np.random.default_rng(42)
+departments = ["Engineering", "Marketing", "Sales", "Customer Support", "R&D"]
+statuses = ["Completed", "In Progress", "Planned"]
+n_rows = 500_000
+
+df_projects = pd.DataFrame(
+    {
+        "Department": rng.choice(departments, n_rows, p=[0.35, 0.15, 0.2, 0.1, 0.2]),
+        # Zipf-distributed project numbers: a few big projects, a long tail
+        "Project": "Project " + np.minimum(rng.zipf(1.3, n_rows), 5_000).astype(str),
+        "Status": rng.choice(statuses, n_rows),
+        "Budget": rng.gamma(2.0, 5_000.0, n_rows),
+    }
+)
+path = ["Department", "Project", "Status"]
+
+full = build_hierarchy(df_projects, path, values="Budget")
+print(f"Full hierarchy: {len(full):,} nodes")
+
+# %%
+# ==============================================================================
+# EXAMPLE: top 10 projects per department, everything else in "Other"
+# ==============================================================================
+start = time.perf_counter()
+top = build_hierarchy(df_projects, path, values="Budget", top_n=[None, 10])
+print(f"Top-10 hierarchy: {len(top):,} nodes in {time.perf_counter() - start:.3f}s (grouping reused from cache)")
+
+# Department totals are unchanged
+print(pd.DataFrame({"Department": top.labels[top.level(0)], "Budget": top.values[top.level(0)].astype(np.int64)}))
+
+fig = top.to_figure(
+    "sunburst",
+    layout=dict(title="Project Budgets: Top 10 Projects per Department", height=800, width=900),
+    hovertemplate="<b>%{label}</b><br>Budget: $%{value:,.0f}<br>%{percentParent:.1%} of %{parent}<extra></extra>",
+    insidetextorientation="radial",
+)
+fig.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE: a tighter view for a small dashboard tile
+# ==============================================================================
+tile = build_hierarchy(df_projects, path, values="Budget", top_n=[3, 5], other_label="Other")
+fig_tile = tile.to_figure("treemap", layout=dict(title="Top 3 Departments, Top 5 Projects Each", height=500))
+fig_tile.show()
@@ -0,0 +1,188 @@
+"""
+Columnar Binary Payloads for Large Dash Tables
+==============================================
+
+A ``go.Table`` figure sends every cell to the browser as JSON text, and the
+server has to format and serialize all of it up front.
+
+This module encodes a DataFrame column by column instead:
+- Numeric columns become base64-encoded little-endian typed arrays, using
+  the smallest integer type that fits (or float32 if you allow it)
+- Text columns are dictionary-encoded as a category list plus integer codes
+- Datetimes are sent as integer days or seconds since the epoch when they
+  fit, otherwise as float64 milliseconds
+
+In Dash the payload lives in a ``dcc.Store`` and ``RENDER_PAGE_JS`` (a
+clientside callback) decodes each column once in the browser, then formats
+and draws only the visible page. ``decode_page`` is the Python equivalent.
+"""
+
+import base64
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# Typed array names understood by RENDER_PAGE_JS (JavaScript has no int64)
+INTEGER_TYPES = ["u1", "i1", "u2", "i2", "u4", "i4"]
+
+
+def _integer_dtype(values):
+    # Smallest typed array that holds every value, or float64 as a fallback
+    if len(values) == 0:
+        return "u1"
+    low, high = values.min(), values.max()
+    for name in INTEGER_TYPES:
+        info = np.iinfo(np.dtype(name))
+        if info.min <= low and high <= info.max:
+            return name
+    return "f8"
+
+
+def encode_array(values, dtype):
+    """Base64 of ``values`` as a little-endian array of ``dtype``."""
+    data = np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder("<"))
+    return base64.b64encode(data.tobytes()).decode("ascii")
+
+
+def encode_column(series, float32=False):
+    """Encode one column as a dict with ``kind``, ``dtype`` and ``bdata``."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        nanos = series.to_numpy("datetime64[ns]").astype(np.int64)
+        if not series.isna().any():
+            # Whole days or seconds fit in much smaller integer arrays
+            for unit, size in [("D", 86_400 * 10**9), ("s", 10**9)]:
+                if (nanos % size == 0).all():
+                    dtype = _integer_dtype(nanos // size)
+                    if dtype != "f8":
+                        return dict(kind="datetime", unit=unit, dtype=dtype, bdata=encode_array(nanos // size, dtype))
+        millis = nanos / 1e6
+        millis[series.isna().to_numpy()] = np.nan
+        return dict(kind="datetime", unit="ms", dtype="f8", bdata=encode_array(millis, "f8"))
+
+    if pd.api.types.is_bool_dtype(series):
+        return dict(kind="numeric", dtype="u1", bdata=encode_array(series.to_numpy(), "u1"))
+
+    if pd.api.types.is_integer_dtype(series):
+        values = series.to_numpy()
+        dtype = _integer_dtype(values)
+        return dict(kind="numeric", dtype=dtype, bdata=encode_array(values, dtype))
+
+    if pd.api.types.is_float_dtype(series):
+        dtype = "f4" if float32 else "f8"
+        return dict(kind="numeric", dtype=dtype, bdata=encode_array(series.to_numpy(), dtype))
+
+    # Everything else is dictionary-encoded as strings
+    codes, categories = pd.factorize(series.astype(str), sort=False)
+    dtype = _integer_dtype(codes)
+    return dict(
+        kind="category",
+        dtype=dtype,
+        bdata=encode_array(codes, dtype),
+        categories=categories.tolist(),
+    )
+
+
+def encode_table(df, float32=False):
+    """Encode a DataFrame into a JSON-ready columnar payload.
+
+    ``token`` changes whenever the encoded data changes, so the browser
+    knows when to drop its decoded columns.
+    """
+    data = {str(column): encode_column(df[column], float32) for column in df.columns}
+    digest = hashlib.sha1()
+    for column, entry in data.items():
+        digest.update(column.encode())
+        digest.update(entry["bdata"].encode())
+    return dict(
+        token=digest.hexdigest(),
+        length=len(df),
+        columns=list(data),
+        data=data,
+    )
+
+
+def decode_column(entry):
+    """Decode one encoded column back into a NumPy array."""
+    values = np.frombuffer(base64.b64decode(entry["bdata"]), dtype=np.dtype(entry["dtype"]).newbyteorder("<"))
+    if entry["kind"] == "category":
+        return np.asarray(entry["categories"], dtype=object)[values]
+    if entry["kind"] == "datetime":
+        return pd.to_datetime(values, unit=entry["unit"]).to_numpy()
+    return values
+
+
+def decode_page(payload, page, page_size=50):
+    """Python reference for ``RENDER_PAGE_JS``: one page as a DataFrame."""
+    start = page * page_size
+    stop = min(payload["length"], start + page_size)
+    return pd.DataFrame(
+        {column: decode_column(payload["data"][column])[start:stop] for column in payload["columns"]},
+        index=pd.RangeIndex(start, stop),
+    )
+
+
+# Dash clientside callback: (payload, page, page_size, formats) -> figure.
+# Decoded columns are cached on window keyed by the payload token, so paging
+# only formats the visible rows. Format names match cell_formatting.FORMATS.
+RENDER_PAGE_JS = """
+function (payload, page, pageSize, formats) {
+    if (!payload) {
+        return window.dash_clientside.no_update;
+    }
+    const cache = (window.binaryTableCache = window.binaryTableCache || {});
+    if (cache.token !== payload.token) {
+        const arrayTypes = {
+            f8: Float64Array, f4: Float32Array,
+            u1: Uint8Array, i1: Int8Array, u2: Uint16Array,
+            i2: Int16Array, u4: Uint32Array, i4: Int32Array
+        };
+        const decode = (entry) => {
+            const raw = atob(entry.bdata);
+            const bytes = new Uint8Array(raw.length);
+            for (let i = 0; i < raw.length; i++) {
+                bytes[i] = raw.charCodeAt(i);
+            }
+            return new arrayTypes[entry.dtype](bytes.buffer);
+        };
+        cache.token = payload.token;
+        cache.columns = payload.columns.map((name) => decode(payload.data[name]));
+    }
+
+    const formatters = {
+        fixed: new Intl.NumberFormat("en-US", {minimumFractionDigits: 2, maximumFractionDigits: 2, useGrouping: false}),
+        thousands: new Intl.NumberFormat("en-US", {maximumFractionDigits: 0}),
+        currency: new Intl.NumberFormat("en-US", {style: "currency", currency: "USD"}),
+        percent: new Intl.NumberFormat("en-US", {style: "percent", minimumFractionDigits: 1, maximumFractionDigits: 1})
+    };
+
+    const start = Math.max(0, (page || 0) * pageSize);
+    const stop = Math.min(payload.length, start + pageSize);
+    const cells = payload.columns.map((name, i) => {
+        const entry = payload.data[name];
+        const values = Array.from(cache.columns[i].subarray(start, stop));
+        if (entry.kind === "category") {
+            return values.map((code) => entry.categories[code]);
+        }
+        if (entry.kind === "datetime") {
+            const scale = {D: 86400000, s: 1000, ms: 1}[entry.unit];
+            const width = entry.unit === "D" ? 10 : 19;
+            return values.map((t) => (isNaN(t) ? "" : new Date(t * scale).toISOString().slice(0, width).replace("T", " ")));
+        }
+        const formatter = formatters[(formats || {})[name]];
+        return values.map((v) => (isNaN(v) ? "" : formatter ? formatter.format(v) : String(v)));
+    });
+
+    return {
+        data: [{
+            type: "table",
+            header: {values: payload.columns.map((name) => "<b>" + name + "</b>"), fill: {color: "paleturquoise"}},
+            cells: {values: cells, fill: {color: "lavender"}, align: "right"}
+        }],
+        layout: {
+            title: {text: "Rows " + (start + 1) + "-" + stop + " of " + payload.length, x: 0.5},
+            margin: {t: 50, l: 10, r: 10, b: 10}
+        }
+    };
+}
+"""
@@ -0,0 +1,92 @@
+# %%
+"""
+Dash App: Large Table Sent as Binary Columns
+============================================
+
+Compares the payload of a full go.Table figure with the columnar binary
+payload from binary_table.py, then serves a Dash app that pages through
+the table in the browser with a clientside callback.
+
+Run the file and open http://127.0.0.1:8050 to try the app.
+"""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from dash import Dash, Input, Output, State, dcc, html
+
+from binary_table import RENDER_PAGE_JS, decode_page, encode_table
+
+# %%
+# ==============================================================================
+# DATA: 200k orders with numeric, text and date columns
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_rows = 200_000
+df_orders = pd.DataFrame(
+    {
+        "Order": np.arange(1, n_rows + 1),
+        "Date": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, n_rows), unit="D"),
+        "Region": rng.choice(["North", "South", "East", "West"], n_rows),
+        "Units": rng.integers(1, 200, n_rows),
+        "Revenue": rng.gamma(2.0, 400.0, n_rows).round(2),
+        "Margin": rng.uniform(-0.1, 0.6, n_rows),
+    }
+)
+formats = {"Revenue": "currency", "Units": "thousands", "Margin": "percent"}
+
+# %%
+# ==============================================================================
+# COMPARISON: full go.Table JSON vs columnar binary payload
+# ==============================================================================
+start = time.perf_counter()
+fig_full = go.Figure(go.Table(header=dict(values=list(df_orders.columns)), cells=dict(values=[df_orders[c] for c in df_orders.columns])))
+table_json = fig_full.to_json()
+table_time = time.perf_counter() - start
+
+start = time.perf_counter()
+payload = encode_table(df_orders)
+payload_json = json.dumps(payload)
+payload_time = time.perf_counter() - start
+
+print(f"go.Table JSON:  {len(table_json) / 1e6:6.1f} MB in {table_time:.2f}s")
+print(f"Binary columns: {len(payload_json) / 1e6:6.1f} MB in {payload_time:.2f}s")
+for column, entry in payload["data"].items():
+    print(f"  {column:>8}: {entry['kind']:>8} as {entry['dtype']}")
+
+# The Python decoder gives the same rows the browser will show
+print(decode_page(payload, page=0, page_size=5))
+
+# %%
+# ==============================================================================
+# DASH APP: the browser decodes once and formats only the visible page
+# ==============================================================================
+PAGE_SIZE = 25
+
+app = Dash(__name__)
+app.layout = html.Div(
+    [
+        html.H3("Orders (binary columnar payload)"),
+        dcc.Store(id="table-payload", data=payload),
+        dcc.Store(id="table-page-size", data=PAGE_SIZE),
+        dcc.Store(id="table-formats", data=formats),
+        html.Label("Page"),
+        dcc.Input(id="table-page", type="number", min=0, max=(n_rows - 1) // PAGE_SIZE, step=1, value=0),
+        dcc.Graph(id="table-graph", style={"height": "800px"}),
+    ]
+)
+
+app.clientside_callback(
+    RENDER_PAGE_JS,
+    Output("table-graph", "figure"),
+    Input("table-payload", "data"),
+    Input("table-page", "value"),
+    State("table-page-size", "data"),
+    State("table-formats", "data"),
+)
+
+if __name__ == "__main__":
+    app.run(debug=True)
@@ -0,0 +1,214 @@
+"""
+Vectorized Cell Formatting for Plotly Tables
+============================================
+
+Formatting table cells one value at a time (an f-string per cell, or a
+Plotly ``format`` string evaluated per cell in the browser) gets slow once a
+numeric column has hundreds of thousands of rows.
+
+This module converts whole NumPy columns to display strings in bulk:
+- Currency, percent, thousands separators and fixed decimals
+- Digits are copied from 3-digit lookup tables into a code point buffer,
+  one digit group at a time across the whole column, so there is no
+  per-value Python loop
+- ``FormattedPageCache`` formats a DataFrame page by page and keeps recently
+  used pages around for ``go.Table`` paging
+
+See cell_formatting_benchmark.py for a comparison against per-value
+f-strings on 1M rows.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+# Supported column formats and their default options
+FORMATS = {
+    "fixed": dict(decimals=2),
+    "thousands": dict(decimals=0, thousands=True),
+    "currency": dict(decimals=2, thousands=True, prefix="$"),
+    "percent": dict(decimals=1, suffix="%", scale=100.0),
+}
+
+
+def _code_points(strings, width):
+    # Lookup table of NUL-padded code points, one row per string
+    table = np.zeros((len(strings), width), dtype=np.uint32)
+    for row, text in enumerate(strings):
+        table[row, :len(text)] = [ord(char) for char in text]
+    return table
+
+
+def format_fixed(
+    values,
+    decimals=2,
+    thousands=False,
+    prefix="",
+    suffix="",
+    scale=1.0,
+    separator=",",
+    na_rep="",
+):
+    """Format a numeric column as strings, e.g. ``-$1,234.50``.
+
+    The sign goes in front of the prefix. NaN and infinite values become
+    ``na_rep``. Values too large for an int64 after scaling by
+    ``10**decimals`` are formatted one by one with an f-string instead.
+    """
+    values = np.asarray(values, dtype=np.float64).ravel() * scale
+    finite = np.isfinite(values)
+    count = len(values)
+    if count == 0:
+        return np.array([], dtype=str)
+
+    # Round once to integer "cents" so the integer and fractional digits agree;
+    # values beyond the int64 range are zeroed here and filled in at the end
+    magnitude = np.abs(np.where(finite, values, 0.0)) * 10**decimals
+    overflow = magnitude >= 2.0**63
+    scaled = np.rint(np.where(overflow, 0.0, magnitude)).astype(np.int64)
+    negative = (values < 0) & (scaled > 0)
+    int_part, frac_part = np.divmod(scaled, 10**decimals)
+
+    # Count 3-digit groups with a few whole-column passes (at most 7)
+    n_groups = np.ones(count, dtype=np.int64)
+    remaining = int_part // 1000
+    while remaining.any():
+        n_groups += remaining > 0
+        remaining //= 1000
+    max_groups = int(n_groups.max())
+
+    separator = separator if thousands else ""
+    group_width = 3 + len(separator)
+    frac_width = decimals + 1 if decimals else 0
+    width = 1 + len(prefix) + 3 + (max_groups - 1) * group_width + frac_width + len(suffix)
+
+    # One NUL-padded row of code points per value, viewed as a "U" array at
+    # the end (trailing NULs are dropped). Inactive writes go to a spare row.
+    buffer = np.zeros(count * width + width, dtype=np.uint32)
+    spare = count * width
+    position = np.arange(count) * width
+
+    # Sign and prefix
+    buffer[position] = np.where(negative, ord("-"), 0)
+    position += negative
+    for char in prefix:
+        buffer[position] = ord(char)
+        position += 1
+
+    # Leading group without zero padding ("7", "42", "999")
+    lead_strings = [str(number) for number in range(1000)]
+    lead_lengths = np.array([len(text) for text in lead_strings])
+    lead = int_part // np.power(1000, n_groups - 1)
+    buffer[position[:, None] + np.arange(3)] = _code_points(lead_strings, 3)[lead]
+    position += lead_lengths[lead]
+
+    # Remaining groups as separator plus 3 zero-padded digits (",007")
+    group_table = _code_points([f"{separator}{number:03d}" for number in range(1000)], group_width)
+    offsets = np.arange(group_width)
+    for group in range(max_groups - 2, -1, -1):
+        active = n_groups - 1 > group
+        digits = (int_part // 1000**group) % 1000
+        target = np.where(active, position, spare)
+        buffer[target[:, None] + offsets] = group_table[digits]
+        position += active * group_width
+
+    # Decimal point and zero-padded fractional digits
+    if decimals:
+        if decimals <= 4:
+            frac_table = _code_points([f".{number:0{decimals}d}" for number in range(10**decimals)], frac_width)
+            buffer[position[:, None] + np.arange(frac_width)] = frac_table[frac_part]
+        else:
+            buffer[position] = ord(".")
+            for digit in range(decimals):
+                place = 10 ** (decimals - 1 - digit)
+                buffer[position + 1 + digit] = 48 + (frac_part // place) % 10
+        position += frac_width
+
+    # Suffix
+    for char in suffix:
+        buffer[position] = ord(char)
+        position += 1
+
+    text = buffer[:spare].view(f"U{width}")
+    if not finite.all():
+        text = np.where(finite, text, na_rep)
+    if overflow.any():
+        grouping = "," if thousands else ""
+        large = [
+            ("-" if value < 0 else "") + prefix + f"{abs(value):{grouping}.{decimals}f}".replace(",", separator) + suffix
+            for value in values[overflow].tolist()
+        ]
+        text = text.astype(f"U{max(width, max(map(len, large)))}")
+        text[overflow] = large
+    return text
+
+
+def format_column(values, kind="fixed", **options):
+    """Format a column with one of the named ``FORMATS`` plus overrides."""
+    if kind not in FORMATS:
+        raise ValueError(f"Unknown format {kind!r}, expected one of {sorted(FORMATS)}")
+    return format_fixed(values, **{**FORMATS[kind], **options})
+
+
+def _format_series(series, spec):
+    # A spec is either a format name ("currency") or a dict with a "kind" key
+    if spec is None:
+        return series.astype(str).to_numpy()
+    if isinstance(spec, str):
+        return format_column(series.to_numpy(), spec)
+    options = dict(spec)
+    return format_column(series.to_numpy(), options.pop("kind", "fixed"), **options)
+
+
+def format_frame(df, formats):
+    """Return a copy of ``df`` with every column formatted as strings.
+
+    ``formats`` maps column names to a format name or an options dict;
+    columns without an entry are converted with ``astype(str)``.
+    """
+    return pd.DataFrame(
+        {column: _format_series(df[column], formats.get(column)) for column in df.columns},
+        index=df.index,
+    )
+
+
+class FormattedPageCache:
+    """Format a large DataFrame one page at a time and cache the results.
+
+    ``page(number)`` returns a list of string columns that can be passed
+    straight to ``go.Table(cells=dict(values=...))``. The least recently used
+    page is evicted once more than ``max_pages`` pages are cached.
+    """
+
+    def __init__(self, df, formats, page_size=100, max_pages=32):
+        self.df = df
+        self.formats = formats
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self._pages = OrderedDict()
+
+    @property
+    def page_count(self):
+        return max(1, -(-len(self.df) // self.page_size))
+
+    def page(self, number):
+        if not 0 <= number < self.page_count:
+            raise IndexError(f"Page {number} out of range (0-{self.page_count - 1})")
+        if number in self._pages:
+            self._pages.move_to_end(number)
+            return self._pages[number]
+
+        start = number * self.page_size
+        frame = format_frame(self.df.iloc[start:start + self.page_size], self.formats)
+        columns = [frame[column].tolist() for column in frame.columns]
+
+        self._pages[number] = columns
+        if len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+        return columns
+
+    def clear(self):
+        self._pages.clear()
+
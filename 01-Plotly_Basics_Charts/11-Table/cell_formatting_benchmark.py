@@ -0,0 +1,111 @@
+# %%
+"""
+Benchmark: Vectorized Cell Formatting vs Per-Value f-strings
+============================================================
+
+Checks edge cases (huge and non-finite values) against f-strings, formats
+1M numeric values as currency, percent, thousands and fixed decimals with
+cell_formatting.py, compares the timing with a Python f-string per value,
+then pages a large go.Table through the page cache.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from cell_formatting import FormattedPageCache, format_column
+
+# %%
+# ==============================================================================
+# CHECK: edge cases against f-strings
+# ==============================================================================
+# Values past the int64 range after scaling take the f-string path instead
+# of overflowing; NaN and infinities become na_rep
+edge_values = np.array([1e15, -1e15, 9.3e12, 1e300, -2e20, 0.004, -0.004, np.nan, np.inf, -np.inf])
+formatted = format_column(edge_values, "thousands", decimals=6, na_rep="n/a")
+assert formatted.tolist() == [f"{x:,.6f}" if np.isfinite(x) else "n/a" for x in edge_values], formatted
+assert format_column([1e300], "currency")[0] == f"${1e300:,.2f}"
+assert format_column([-5e18], "fixed")[0] == f"{-5e18:.2f}"
+print("Edge cases match f-strings")
+
+# %%
+# ==============================================================================
+# BENCHMARK: vectorized formatting vs per-value f-strings on 1M rows
+# ==============================================================================
+rng = np.random.default_rng(42)
+n_rows = 1_000_000
+amounts = rng.normal(0, 1_000_000, n_rows)
+rates = rng.uniform(-0.5, 1.5, n_rows)
+
+
+# Reference f-string with the sign placed in front of the currency symbol
+def currency_fstring(x):
+    return f"-${-x:,.2f}" if x < 0 and round(x, 2) else f"${abs(x):,.2f}"
+
+
+benchmarks = [
+    ("currency", amounts, currency_fstring),
+    ("percent", rates, lambda x: f"{x * 100:.1f}%"),
+    ("thousands", amounts, lambda x: f"{x:,.0f}"),
+    ("fixed", amounts, lambda x: f"{x:.2f}"),
+]
+
+print(f"=== Formatting {n_rows:,} values ===")
+for kind, column, reference in benchmarks:
+    start = time.perf_counter()
+    expected = [reference(x) for x in column.tolist()]
+    fstring_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    formatted = format_column(column, kind)
+    vector_time = time.perf_counter() - start
+
+    # Exact halfway cases may round differently, so report the agreement
+    matches = np.mean(formatted == np.array(expected))
+    print(
+        f"{kind:>9}: f-strings {fstring_time:.3f}s | vectorized {vector_time:.3f}s "
+        f"| {fstring_time / vector_time:.1f}x faster | {matches:.4%} identical"
+    )
+
+# %%
+# ==============================================================================
+# EXAMPLE: paging a large table through the formatted page cache
+# ==============================================================================
+df_sales = pd.DataFrame(
+    {
+        "Order": np.arange(n_rows),
+        "Revenue": np.abs(amounts),
+        "Units": rng.integers(1, 50_000, n_rows),
+        "Margin": rates / 3,
+    }
+)
+cache = FormattedPageCache(
+    df_sales,
+    formats={"Revenue": "currency", "Units": "thousands", "Margin": "percent"},
+    page_size=20,
+)
+
+start = time.perf_counter()
+first_page = cache.page(0)
+print(f"\nFirst page formatted in {time.perf_counter() - start:.4f}s")
+start = time.perf_counter()
+cache.page(0)
+print(f"Cached page returned in {time.perf_counter() - start:.6f}s")
+
+fig = go.Figure(
+    go.Table(
+        header=dict(
+            values=[f"<b>{col}</b>" for col in df_sales.columns],
+            fill_color="paleturquoise",
+            align="center",
+        ),
+        cells=dict(values=first_page, fill_color="lavender", align="right"),
+    )
+)
+fig.update_layout(
+    title_text=f"Page 1 of {cache.page_count:,} (formatted in bulk)",
+    title_x=0.5,
+)
+fig.show()
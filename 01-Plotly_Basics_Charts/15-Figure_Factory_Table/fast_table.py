@@ -0,0 +1,169 @@
+"""
+Scalable Figure Factory Style Tables
+====================================
+
+``ff.create_table`` draws a striped heatmap and then adds one layout
+annotation per cell. A 10k x 10 table becomes 100k annotation objects, each
+validated in Python and laid out separately in the browser.
+
+``create_fast_table`` keeps the same look (header colorscale, striping,
+bold header/index, font colors, height) and the same arguments, but writes
+the cell text into text-mode scatter traces built from NumPy arrays: one
+trace per font color instead of one annotation per cell.
+
+See fast_table_benchmark.py for timings against ``create_table``.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Same defaults as plotly.figure_factory.create_table
+DEFAULT_COLORSCALE = [[0, "#00083e"], [0.5, "#ededee"], [1, "#ffffff"]]
+DEFAULT_FONT_COLORS = ["#ffffff", "#000000", "#000000"]
+
+# Number of cells above which render_mode="auto" switches to WebGL
+WEBGL_THRESHOLD = 1000
+
+
+def table_text_to_array(table_text, index=False, index_title=""):
+    """Convert a DataFrame or list of lists into a 2D array of strings.
+
+    Row 0 holds the headers. With ``index=True`` the DataFrame index (or
+    the first item of each list) becomes a header-styled first column.
+    """
+    if isinstance(table_text, pd.DataFrame):
+        body = table_text.astype(str).to_numpy()
+        header = np.array([str(column) for column in table_text.columns])
+        if index:
+            body = np.column_stack([table_text.index.astype(str).to_numpy(), body])
+            header = np.concatenate([[str(index_title)], header])
+        return np.vstack([header, body])
+    return np.array([[str(value) for value in row] for row in table_text])
+
+
+def table_matrix(n_rows, n_cols, index=False):
+    """Heatmap z values: 0 for the header (and index), then 0.5/1 stripes."""
+    stripes = np.where(np.arange(n_rows) % 2 == 1, 0.5, 1.0)
+    stripes[0] = 0
+    matrix = np.repeat(stripes[:, None], n_cols, axis=1)
+    if index:
+        matrix[:, 0] = 0
+    return matrix
+
+
+def row_font_colors(font_colors, n_rows):
+    """Expand 1, 3 or ``n_rows`` font colors to one color per row."""
+    if len(font_colors) == 1:
+        return np.full(n_rows, font_colors[0], dtype=object)
+    if len(font_colors) == 3:
+        colors = np.where(np.arange(n_rows) % 2 == 1, font_colors[1], font_colors[2]).astype(object)
+        colors[0] = font_colors[0]
+        return colors
+    if len(font_colors) == n_rows:
+        return np.asarray(font_colors, dtype=object)
+    raise ValueError("font_colors should be a list of length 1, 3 or len(text)")
+
+
+def make_text_traces(text, font_colors, index=False, annotation_offset=0.45, render_mode="auto"):
+    """Build the text traces for every cell of ``text``.
+
+    Cells are grouped by font color so each trace has a scalar color; the
+    defaults give two traces (header/index and body) whatever the row count.
+    """
+    n_rows, n_cols = text.shape
+
+    # Header and index cells are bold and use the header font color
+    cells = text.astype(object)
+    cells[0] = ["<b>" + value + "</b>" for value in text[0]]
+    cell_colors = np.repeat(row_font_colors(font_colors, n_rows)[:, None], n_cols, axis=1)
+    if index:
+        cells[:, 0] = ["<b>" + value + "</b>" for value in text[:, 0]]
+        cell_colors[:, 0] = font_colors[0]
+
+    x = np.tile(np.arange(n_cols) - annotation_offset, n_rows)
+    y = np.repeat(np.arange(n_rows), n_cols)
+    cells, cell_colors = cells.ravel(), cell_colors.ravel()
+
+    use_webgl = render_mode == "webgl" or (render_mode == "auto" and text.size > WEBGL_THRESHOLD)
+    traces = []
+    for color in pd.unique(cell_colors):
+        selected = cell_colors == color
+        traces.append(
+            dict(
+                type="scattergl" if use_webgl else "scatter",
+                x=x[selected],
+                y=y[selected],
+                text=cells[selected],
+                mode="text",
+                textposition="middle right",
+                textfont=dict(color=color),
+                hoverinfo="skip",
+                showlegend=False,
+            )
+        )
+    return traces
+
+
+def table_layout(n_rows, n_cols, height_constant=30):
+    """Layout matching ``create_table``, with fixed ranges for the text trace."""
+    return dict(
+        height=n_rows * height_constant + 50,
+        margin=dict(t=0, b=0, r=0, l=0),
+        yaxis=dict(
+            range=[n_rows - 0.5, -0.5],
+            zeroline=False,
+            gridwidth=2,
+            ticks="",
+            dtick=1,
+            tick0=0.5,
+            showticklabels=False,
+        ),
+        xaxis=dict(
+            range=[-0.5, n_cols - 0.5],
+            zeroline=False,
+            gridwidth=2,
+            ticks="",
+            dtick=1,
+            tick0=-0.5,
+            showticklabels=False,
+        ),
+    )
+
+
+def create_fast_table(
+    table_text,
+    colorscale=None,
+    font_colors=None,
+    index=False,
+    index_title="",
+    annotation_offset=0.45,
+    height_constant=30,
+    hoverinfo="none",
+    render_mode="auto",
+    **kwargs,
+):
+    """Drop-in replacement for ``ff.create_table`` without per-cell annotations.
+
+    Accepts the same arguments as ``create_table``; ``kwargs`` are passed to
+    the heatmap trace. ``render_mode`` is "svg", "webgl" or "auto" (WebGL
+    once the table has more than ``WEBGL_THRESHOLD`` cells).
+    """
+    colorscale = colorscale if colorscale is not None else DEFAULT_COLORSCALE
+    font_colors = font_colors if font_colors is not None else DEFAULT_FONT_COLORS
+
+    text = table_text_to_array(table_text, index, index_title)
+    n_rows, n_cols = text.shape
+
+    heatmap = dict(
+        type="heatmap",
+        z=table_matrix(n_rows, n_cols, index),
+        opacity=0.75,
+        colorscale=colorscale,
+        showscale=False,
+        hoverinfo=hoverinfo,
+        **{"zmin": 0, "zmax": 1, **kwargs},
+    )
+    cells = make_text_traces(text, font_colors, index, annotation_offset, render_mode)
+
+    return go.Figure(data=[heatmap] + cells, layout=table_layout(n_rows, n_cols, height_constant))
@@ -0,0 +1,76 @@
+# %%
+"""
+Benchmark: create_fast_table vs ff.create_table
+===============================================
+
+Builds the same striped table with Plotly's Figure Factory and with
+fast_table.py at increasing row counts and reports build time, JSON
+serialization time, payload size and the number of layout annotations.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.figure_factory as ff
+
+from fast_table import create_fast_table
+
+# ff.create_table needs roughly 6s per 1,000 rows x 10 columns, so larger
+# sizes are only timed for the fast table unless RUN_SLOW is enabled
+RUN_SLOW = False
+MAX_FF_ROWS = 1_000
+
+# %%
+# ==============================================================================
+# EXAMPLE: the same table built both ways
+# ==============================================================================
+df_sales = pd.DataFrame(
+    {
+        "Product": ["Laptop", "Mouse", "Keyboard", "Monitor", "Headphones"],
+        "Price": ["$999", "$29", "$79", "$349", "$159"],
+        "Stock": [45, 230, 156, 89, 134],
+        "Sales": [120, 450, 280, 95, 210],
+    }
+)
+colorscale = [[0, "#4d004c"], [0.5, "#8b008b"], [1, "#e6d5f0"]]
+
+ff.create_table(df_sales, colorscale=colorscale).show()
+create_fast_table(df_sales, colorscale=colorscale).show()
+
+
+# %%
+# ==============================================================================
+# BENCHMARK: build time, serialization time and payload size
+# ==============================================================================
+def measure(factory, df):
+    start = time.perf_counter()
+    fig = factory(df)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    payload = fig.to_json()
+    serialize = time.perf_counter() - start
+    return build, serialize, len(payload), len(fig.layout.annotations)
+
+
+rng = np.random.default_rng(42)
+n_cols = 10
+
+print(f"{'rows':>8} {'method':>12} {'build (s)':>10} {'json (s)':>9} {'size (MB)':>10} {'annotations':>12}")
+for n_rows in [100, 1_000, 10_000, 100_000]:
+    df = pd.DataFrame(
+        rng.normal(1000, 250, (n_rows, n_cols)).round(2),
+        columns=[f"Metric {i + 1}" for i in range(n_cols)],
+    )
+
+    factories = [("fast_table", create_fast_table)]
+    if n_rows <= MAX_FF_ROWS or (RUN_SLOW and n_rows <= 10_000):
+        factories.insert(0, ("create_table", ff.create_table))
+
+    for name, factory in factories:
+        build, serialize, size, annotations = measure(factory, df)
+        print(
+            f"{n_rows:>8,} {name:>12} {build:>10.3f} {serialize:>9.3f} "
+            f"{size / 1e6:>10.2f} {annotations:>12,}"
+        )
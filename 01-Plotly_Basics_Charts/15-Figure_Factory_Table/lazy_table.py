@@ -0,0 +1,179 @@
+"""
+Lazy Figure Factory Tables
+==========================
+
+``ff.create_table`` builds the heatmap rows and one annotation per cell for
+the whole table up front, and sizes the figure to fit every row. For long
+tables most of that work is never seen.
+
+``LazyTable`` keeps the ``create_table`` look but:
+- Sizes the figure for the rows that fit in ``max_height`` (auto height)
+- Only creates heatmap rows and annotations for that visible window
+- Adds the next rows on demand as the user scrolls (``scroll``) or returns a
+  small standalone figure per page (``page_figure``)
+
+``scroll`` edits a figure dict in place with plain list operations, so it
+also works on a ``dash.Patch`` and only the new rows are sent to the browser.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from fast_table import (
+    DEFAULT_COLORSCALE,
+    DEFAULT_FONT_COLORS,
+    row_font_colors,
+    table_layout,
+    table_text_to_array,
+)
+
+
+def auto_height(n_rows, height_constant=30, max_height=None):
+    """Figure height for ``n_rows`` table rows, capped at ``max_height``."""
+    height = n_rows * height_constant + 50
+    return height if max_height is None else min(height, max_height)
+
+
+class LazyTable:
+    """A figure factory table whose rows are built only when they are shown.
+
+    The object tracks how many rows the figure holds, so use one
+    ``LazyTable`` per displayed figure.
+    """
+
+    def __init__(
+        self,
+        table_text,
+        colorscale=None,
+        font_colors=None,
+        index=False,
+        index_title="",
+        annotation_offset=0.45,
+        height_constant=30,
+        max_height=600,
+        page_rows=None,
+        hoverinfo="none",
+        **kwargs,
+    ):
+        self.text = table_text_to_array(table_text, index, index_title)
+        self.n_rows, self.n_cols = self.text.shape
+        self.colorscale = colorscale if colorscale is not None else DEFAULT_COLORSCALE
+        font_colors = font_colors if font_colors is not None else DEFAULT_FONT_COLORS
+        self.header_color = font_colors[0]
+        self.font_colors = row_font_colors(font_colors, self.n_rows)
+        self.index = index
+        self.annotation_offset = annotation_offset
+        self.height_constant = height_constant
+        self.hoverinfo = hoverinfo
+        self.heatmap_kwargs = kwargs
+
+        # Rows (including the header) that fit in max_height
+        fitting_rows = (max_height - 50) // height_constant
+        self.visible_rows = int(np.clip(fitting_rows, 2, self.n_rows))
+        # Rows loaded per scroll step; defaults to one screen
+        self.page_rows = page_rows or self.visible_rows - 1
+        self.loaded_rows = 0
+
+    @property
+    def height(self):
+        return auto_height(self.visible_rows, self.height_constant)
+
+    @property
+    def page_count(self):
+        return max(1, -(-(self.n_rows - 1) // self.page_rows))
+
+    def annotations(self, rows, positions=None):
+        """Annotation dicts for the given table rows, placed at ``positions``."""
+        positions = rows if positions is None else positions
+        annotations = []
+        for row, y in zip(rows, positions):
+            for col, value in enumerate(self.text[row]):
+                # Bold text and header color in the header and index
+                is_header = row == 0 or (self.index and col == 0)
+                annotations.append(
+                    dict(
+                        text=f"<b>{value}</b>" if is_header else value,
+                        x=col - self.annotation_offset,
+                        y=int(y),
+                        xref="x1",
+                        yref="y1",
+                        align="left",
+                        xanchor="left",
+                        font=dict(color=self.header_color if is_header else self.font_colors[row]),
+                        showarrow=False,
+                    )
+                )
+        return annotations
+
+    def _z(self, rows):
+        # Same striping as table_matrix, for just the requested rows
+        rows = np.asarray(rows)
+        stripes = np.where(rows % 2 == 1, 0.5, 1.0)
+        stripes[rows == 0] = 0
+        z = np.repeat(stripes[:, None], self.n_cols, axis=1)
+        if self.index:
+            z[:, 0] = 0
+        return z
+
+    def _heatmap(self, z):
+        return dict(
+            type="heatmap",
+            z=z.tolist(),
+            opacity=0.75,
+            colorscale=self.colorscale,
+            showscale=False,
+            hoverinfo=self.hoverinfo,
+            **{"zmin": 0, "zmax": 1, **self.heatmap_kwargs},
+        )
+
+    def _layout(self, annotations):
+        layout = table_layout(self.visible_rows, self.n_cols, self.height_constant)
+        layout["annotations"] = annotations
+        layout["xaxis"]["fixedrange"] = True
+        layout["dragmode"] = "pan"
+        return layout
+
+    def figure(self):
+        """Initial figure with only the first screen of rows built."""
+        self.loaded_rows = self.visible_rows
+        rows = range(self.loaded_rows)
+        return go.Figure(data=[self._heatmap(self._z(rows))], layout=self._layout(self.annotations(rows)))
+
+    def scroll(self, figure, first_row):
+        """Show rows from ``first_row`` on, building any rows not loaded yet.
+
+        ``figure`` is a figure dict (``fig.to_dict()``, a Dash ``State``) or a
+        ``dash.Patch``; it is updated in place and returned.
+        """
+        first_row = int(np.clip(first_row, 0, self.n_rows - self.visible_rows))
+        needed = first_row + self.visible_rows
+        if needed > self.loaded_rows:
+            # Load whole pages so small scrolls don't trigger many updates
+            stop = min(self.n_rows, max(needed, self.loaded_rows + self.page_rows))
+            rows = range(self.loaded_rows, stop)
+            figure["data"][0]["z"].extend(self._z(rows).tolist())
+            figure["layout"]["annotations"].extend(self.annotations(rows))
+            self.loaded_rows = stop
+        figure["layout"]["yaxis"]["range"] = [needed - 0.5, first_row - 0.5]
+        return figure
+
+    def page_figure(self, page):
+        """Standalone figure for one page: the header plus ``page_rows`` rows."""
+        if not 0 <= page < self.page_count:
+            raise IndexError(f"Page {page} out of range (0-{self.page_count - 1})")
+        start = 1 + page * self.page_rows
+        stop = min(self.n_rows, start + self.page_rows)
+
+        rows = [0] + list(range(start, stop))
+        layout = self._layout(self.annotations(rows, positions=range(len(rows))))
+        layout["yaxis"]["range"] = [len(rows) - 0.5, -0.5]
+        layout["height"] = auto_height(len(rows), self.height_constant)
+        layout["dragmode"] = False
+        return go.Figure(data=[self._heatmap(self._z(rows))], layout=layout)
+
+
+def first_row_from_relayout(relayout_data):
+    """Top visible row from a Dash ``relayoutData`` pan event, if any."""
+    if relayout_data and "yaxis.range[1]" in relayout_data:
+        return int(round(relayout_data["yaxis.range[1]"] + 0.5))
+    return None
@@ -0,0 +1,78 @@
+# %%
+"""
+Lazy Figure Factory Tables
+==========================
+
+Compares ff.create_table with LazyTable on a long version of the product
+table from example2/example3: build time and payload for the first screen,
+then scrolling further down and paging through the rows.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.figure_factory as ff
+import plotly.graph_objects as go
+
+from lazy_table import LazyTable
+
+# %%
+# ==============================================================================
+# DATA: a long product list with the example3 colorscale
+# ==============================================================================
+rng = np.random.default_rng(7)
+n_products = 2_000
+df_products = pd.DataFrame(
+    {
+        "Product": [f"Product {i:05d}" for i in range(n_products)],
+        "Price": [f"${price}" for price in rng.integers(10, 2_000, n_products)],
+        "Stock": rng.integers(0, 500, n_products),
+        "Sales": rng.integers(0, 1_000, n_products),
+    }
+)
+colorscale = [[0, "#4d004c"], [0.5, "#f2e5ff"], [1, "#ffffff"]]
+
+# %%
+# ==============================================================================
+# EXAMPLE 1: first screen of ff.create_table vs LazyTable
+# ==============================================================================
+start = time.perf_counter()
+fig_full = ff.create_table(df_products, colorscale=colorscale)
+full_time = time.perf_counter() - start
+
+table = LazyTable(df_products, colorscale=colorscale, max_height=600)
+start = time.perf_counter()
+fig_lazy = table.figure()
+lazy_time = time.perf_counter() - start
+
+print(f"create_table: {full_time:.3f}s, {len(fig_full.layout.annotations):,} annotations, "
+      f"{len(fig_full.to_json()) / 1e3:,.0f} KB, height {fig_full.layout.height}px")
+print(f"LazyTable:    {lazy_time:.3f}s, {len(fig_lazy.layout.annotations):,} annotations, "
+      f"{len(fig_lazy.to_json()) / 1e3:,.0f} KB, height {fig_lazy.layout.height}px")
+print(f"Visible fraction: {table.visible_rows / table.n_rows:.1%}")
+
+fig_lazy.show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 2: scrolling adds only the newly visible rows
+#
+# In Dash, pass a dash.Patch() instead of the dict and read the top row from
+# the graph's relayoutData with first_row_from_relayout().
+# ==============================================================================
+fig_dict = fig_lazy.to_dict()
+for first_row in [10, 250, 1_500]:
+    start = time.perf_counter()
+    table.scroll(fig_dict, first_row)
+    print(f"Scrolled to row {first_row:>5,} in {time.perf_counter() - start:.4f}s "
+          f"({table.loaded_rows:,} of {table.n_rows:,} rows built)")
+
+go.Figure(fig_dict).show()
+
+# %%
+# ==============================================================================
+# EXAMPLE 3: paging with the header repeated on every page
+# ==============================================================================
+print(f"{table.page_count} pages of {table.page_rows} rows")
+table.page_figure(3).show()
@@ -0,0 +1,123 @@
+"""
+Table + Chart Combos from Shared Aggregates
+===========================================
+
+A common figure factory layout puts a summary table next to a bar chart of
+the same numbers. Building each side separately means running the same
+``groupby`` twice, and dashboards with many table/chart pairs repeat it for
+every pair.
+
+``create_table_chart`` computes the grouped aggregates once through an
+``AggregateCache`` keyed on the DataFrame's content hash and the grouping,
+then feeds both the table (via fast_table.py) and the bar chart from that
+single result.
+"""
+
+import sys
+from pathlib import Path
+
+import plotly.graph_objects as go
+
+from fast_table import create_fast_table
+
+# Shared helpers live in 01-Plotly_Basics_Charts/plotly_perf
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from plotly_perf.cache import ContentCache, frame_hash
+
+
+class AggregateCache(ContentCache):
+    """Grouped aggregates keyed on (data hash, group columns, aggregations).
+
+    The hash covers the values, index and column names of the DataFrame, so
+    a second frame with the same data shares the result and an edited frame
+    gets a fresh one. Holds at most ``max_entries`` results.
+    """
+
+    def __init__(self, max_entries=64):
+        super().__init__(max_entries)
+
+    def get(self, df, by, aggregations, key=None):
+        """Return ``df.groupby(by).agg(aggregations)`` as a flat DataFrame.
+
+        ``aggregations`` values may be a name or a list of names, as with
+        ``DataFrame.agg``. With any list, every aggregated column is named
+        "<column> <aggregation>" (e.g. "Price min") instead of getting a
+        two-level header. Pass ``key`` to identify the data yourself and
+        skip hashing ``df``.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        # Lists aren't hashable; as tuples they key the same aggregation.
+        # Kept in order, since the order sets the summary's column order
+        functions = tuple(
+            (column, how if isinstance(how, str) else tuple(how)) for column, how in aggregations.items()
+        )
+        cache_key = (key or frame_hash(df, index=True), tuple(by), functions)
+        return self.lookup(cache_key, lambda: self._aggregate(df, by, aggregations))
+
+    @staticmethod
+    def _aggregate(df, by, aggregations):
+        summary = df.groupby(by, sort=True, observed=True).agg(aggregations)
+        if summary.columns.nlevels > 1:
+            summary.columns = [" ".join(map(str, name)) for name in summary.columns]
+        return summary.reset_index()
+
+
+# Shared by every combo that doesn't pass its own cache
+default_cache = AggregateCache()
+
+
+def create_table_chart(
+    df,
+    by,
+    aggregations,
+    chart_column=None,
+    title=None,
+    bar_color="#00083e",
+    table_width=0.5,
+    decimals=2,
+    cache=None,
+    key=None,
+    **table_kwargs,
+):
+    """Summary table beside a bar chart, both from one cached aggregation.
+
+    ``aggregations`` maps columns to pandas aggregation names, e.g.
+    ``{"Sales": "sum", "Price": "mean"}``, or lists of names (see
+    ``AggregateCache.get`` for the column names these give).
+    ``chart_column`` picks the summary column to plot (the first aggregated
+    one by default). Extra keyword arguments go to ``create_fast_table``.
+    """
+    cache = cache if cache is not None else default_cache
+    summary = cache.get(df, by, aggregations, key=key)
+    by = [by] if isinstance(by, str) else list(by)
+    chart_column = chart_column or summary.columns[len(by)]
+    if chart_column not in summary.columns[len(by):]:
+        raise ValueError(f"chart_column {chart_column!r} is not one of {summary.columns[len(by):].tolist()}")
+    how = aggregations.get(chart_column)
+    chart_label = f"{chart_column} ({how})" if isinstance(how, str) else chart_column
+
+    # Table side: rounded values, header styled like ff.create_table
+    fig = create_fast_table(summary.round(decimals), **table_kwargs)
+
+    # Chart side: the same aggregated rows, one bar per group
+    labels = summary[by].astype(str).agg(" / ".join, axis=1)
+    fig.add_trace(
+        go.Bar(
+            x=labels,
+            y=summary[chart_column],
+            xaxis="x2",
+            yaxis="y2",
+            marker=dict(color=bar_color),
+            name=chart_label,
+        )
+    )
+    fig.update_layout(
+        title_text=title,
+        height=max(fig.layout.height, 400),
+        margin=dict(t=50 if title else 10, b=50, l=10, r=10),
+        xaxis=dict(domain=[0, table_width]),
+        xaxis2=dict(domain=[table_width + 0.05, 1], anchor="y2"),
+        yaxis2=dict(anchor="x2", title=chart_label),
+        showlegend=False,
+    )
+    return fig
@@ -0,0 +1,210 @@
+"""
+File System Icicle and Treemap Charts
+=====================================
+
+icicle_chart_advanced.py draws a file system typed in by hand. This module
+scans a real directory tree and draws it, even for volumes with millions of
+files:
+- ``scan_directory`` lists directories with ``os.scandir`` on a pool of
+  worker threads (the ``stat`` calls release the GIL, so they overlap),
+  handing each task a batch of directories
+- Sizes are stored as flat NumPy arrays and summed bottom-up one depth
+  level at a time
+- ``FileTree.prune`` keeps the ``top_n`` largest entries of every directory
+  down to ``max_depth`` and merges the rest into one "(N more)" node, so the
+  figure stays a bounded size however big the volume is
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import os
+from pathlib import Path
+import sys
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Shared helpers live in 01-Plotly_Basics_Charts/plotly_perf
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from plotly_perf.hierarchy import TRACE_TYPES, sibling_rank
+
+# Most directories one scanning task lists
+SCAN_BATCH = 64
+
+
+def _scan_one(path, files):
+    # One directory: (file names, file sizes, subdirectory names, errors)
+    names, sizes, subdirs, errors = [], [], [], 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    else:
+                        names.append(entry.name)
+                        sizes.append(entry.stat(follow_symlinks=False).st_size)
+                except OSError:
+                    errors += 1
+    except OSError:
+        return [], [], [], 1
+    if not files:
+        # Fold the files into the directory's own size
+        return [], [sum(sizes)], subdirs, errors
+    return names, sizes, subdirs, errors
+
+
+def _scan_batch(paths, files):
+    return [_scan_one(path, files) for path in paths]
+
+
+class FileTree:
+    """Flat arrays describing a scanned directory tree.
+
+    Node 0 is the scanned root. ``parent`` holds parent positions (-1 for the
+    root), ``size`` each node's own size in bytes (0 for directories unless
+    files were folded into them) and ``depth`` the distance from the root.
+    """
+
+    def __init__(self, root, names, parent, size, depth, is_dir, errors=0):
+        self.root = root
+        self.names = names
+        self.parent = parent
+        self.size = size
+        self.depth = depth
+        self.is_dir = is_dir
+        self.errors = errors
+        self._totals = None
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def totals(self):
+        """Size of every node including everything below it."""
+        if self._totals is None:
+            totals = self.size.astype(np.float64)
+            for depth in range(self.depth.max(), 0, -1):
+                nodes = np.flatnonzero(self.depth == depth)
+                np.add.at(totals, self.parent[nodes], totals[nodes])
+            self._totals = totals
+        return self._totals
+
+    def prune(self, top_n=20, max_depth=6):
+        """ids/labels/parents/values for the largest entries only.
+
+        Keeps the ``top_n`` largest children of every kept directory, down to
+        ``max_depth`` levels below the root; the other children of a
+        directory become one "(N more)" node with their combined size.
+        Deeper levels are left out (their size is still in their parents).
+        """
+        totals = self.totals
+        n_nodes = len(self)
+        max_depth = self.depth.max() if max_depth is None else max_depth
+
+        # Candidates: within the top N by size among their siblings and not
+        # too deep. Kept: candidates whose directories are all kept too
+        candidate = (sibling_rank(self.parent, totals) < top_n) & (self.depth <= max_depth)
+        candidate[0] = True
+        by_depth = np.flatnonzero(candidate)
+        by_depth = by_depth[np.argsort(self.depth[by_depth], kind="stable")]
+        level_offsets = np.searchsorted(self.depth[by_depth], np.arange(max_depth + 2))
+        kept = np.zeros(n_nodes, dtype=bool)
+        kept[0] = True
+        ids = np.empty(n_nodes, dtype=object)
+        ids[0] = self.names[0]
+        for depth in range(1, max_depth + 1):
+            nodes = by_depth[level_offsets[depth]:level_offsets[depth + 1]]
+            nodes = nodes[kept[self.parent[nodes]]]
+            kept[nodes] = True
+            ids[nodes] = ids[self.parent[nodes]] + "/" + self.names[nodes]
+
+        # Children of kept directories that missed the cut, one node per directory
+        within = self.depth <= max_depth
+        merged = np.flatnonzero(~kept & within & kept[np.maximum(self.parent, 0)] & (self.parent >= 0))
+        other_parents, other_of_node, other_counts = np.unique(
+            self.parent[merged], return_inverse=True, return_counts=True
+        )
+        other_values = np.bincount(other_of_node, weights=totals[merged], minlength=len(other_parents))
+
+        kept_nodes = np.flatnonzero(kept)
+        parent_ids = np.where(self.parent[kept_nodes] >= 0, ids[np.maximum(self.parent[kept_nodes], 0)], "")
+        return dict(
+            # "//" can't occur in a real path, so the extra ids never clash
+            ids=np.concatenate([ids[kept_nodes], ids[other_parents] + "//more"]),
+            labels=np.concatenate(
+                [self.names[kept_nodes], np.array([f"({count:,} more)" for count in other_counts], dtype=object)]
+            ),
+            parents=np.concatenate([parent_ids, ids[other_parents]]).astype(object),
+            values=np.concatenate([totals[kept_nodes], other_values]),
+        )
+
+    def to_trace(self, kind="icicle", top_n=20, max_depth=6, **trace_kwargs):
+        """Icicle (or treemap/sunburst) trace of ``prune(top_n, max_depth)``."""
+        defaults = dict(
+            branchvalues="total",
+            hovertemplate="<b>%{id}</b><br>%{value:.3s}B<br>%{percentRoot:.1%} of total<extra></extra>",
+            root_color="lightgrey",
+        )
+        return TRACE_TYPES[kind](**self.prune(top_n, max_depth), **{**defaults, **trace_kwargs})
+
+    def to_figure(self, kind="icicle", top_n=20, max_depth=6, layout=None, **trace_kwargs):
+        layout = layout or dict(title=f"Disk usage of {self.root}", margin=dict(t=50, l=25, r=25, b=25))
+        return go.Figure(self.to_trace(kind, top_n, max_depth, **trace_kwargs), layout=layout)
+
+
+def scan_directory(root, max_workers=16, files=True):
+    """Scan ``root`` recursively into a ``FileTree``.
+
+    Directories are listed on ``max_workers`` threads (1 scans serially), in
+    batches of up to ``SCAN_BATCH`` directories per task so that thread pool
+    bookkeeping stays small next to the listing itself. Symlinks are not
+    followed. With ``files=False`` file sizes are added to their directory
+    instead of becoming nodes, which keeps very large scans small.
+    Unreadable entries are skipped and counted in ``errors``.
+    """
+    root = os.path.abspath(root)
+    names, parent, size, depth, is_dir = [os.path.basename(root) or root], [-1], [0], [0], [True]
+    errors = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Each task lists a batch of directories: future -> (node indices, paths)
+        pending = {pool.submit(_scan_batch, [root], files): ([0], [root])}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            next_indices, next_paths = [], []
+            for future in done:
+                indices, paths = pending.pop(future)
+                for index, path, (file_names, file_sizes, subdirs, scan_errors) in zip(indices, paths, future.result()):
+                    errors += scan_errors
+                    if files:
+                        names.extend(file_names)
+                        size.extend(file_sizes)
+                        parent.extend([index] * len(file_names))
+                        depth.extend([depth[index] + 1] * len(file_names))
+                        is_dir.extend([False] * len(file_names))
+                    else:
+                        size[index] = file_sizes[0] if file_sizes else 0
+
+                    next_indices.extend(range(len(names), len(names) + len(subdirs)))
+                    next_paths.extend(os.path.join(path, name) for name in subdirs)
+                    names.extend(subdirs)
+                    size.extend([0] * len(subdirs))
+                    parent.extend([index] * len(subdirs))
+                    depth.extend([depth[index] + 1] * len(subdirs))
+                    is_dir.extend([True] * len(subdirs))
+
+            # Small batches while there is little to do, so every worker gets some
+            batch = max(1, min(SCAN_BATCH, len(next_paths) // max_workers))
+            for first in range(0, len(next_paths), batch):
+                chunk = slice(first, first + batch)
+                pending[pool.submit(_scan_batch, next_paths[chunk], files)] = (next_indices[chunk], next_paths[chunk])
+
+    return FileTree(
+        root=root,
+        names=np.array(names, dtype=object),
+        parent=np.array(parent, dtype=np.int64),
+        size=np.array(size, dtype=np.int64),
+        depth=np.array(depth, dtype=np.int64),
+        is_dir=np.array(is_dir, dtype=bool),
+        errors=errors,
+    )
@@ -0,0 +1,18 @@
+"""
+Helpers Shared by the Chart Folders
+===================================
+
+The scalable table, hierarchy and Gantt modules live next to the examples
+that use them, one chart type per folder. The few pieces they have in
+common live here:
+- ``cache``: content hashes of DataFrame columns and a least recently used
+  store keyed on them
+- ``csr``: positions grouped by parent (compressed sparse row), for walking
+  trees and dependency graphs level by level
+- ``hierarchy``: the sunburst/treemap/icicle trace types and the sibling
+  ranking behind top-N pruning
+- ``benchmark``: build time, JSON size and peak memory of a figure
+
+Modules add ``01-Plotly_Basics_Charts`` to ``sys.path`` and import from
+``plotly_perf`` directly.
+"""
@@ -0,0 +1,81 @@
+"""
+Content-Keyed Result Caches
+===========================
+
+Dashboards redraw the same data over and over, so the expensive step
+(grouping, parsing, aggregating) is worth caching. The cache key has to
+come from the data itself: two calls with equal columns should share a
+result, and a column edited in place must not return the old one. So the
+columns are hashed on every lookup. Hashing is a single pass over the
+bytes, much cheaper than the work it saves; callers that already know
+their data can pass their own key instead.
+"""
+
+from collections import OrderedDict
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+def column_hash(values):
+    """Stable hash of one column's contents (a Series or array)."""
+    series = values if isinstance(values, pd.Series) else pd.Series(np.asarray(values))
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype != object:
+        return hashlib.sha1(np.ascontiguousarray(series.to_numpy()).tobytes() + str(dtype).encode()).hexdigest()
+    if dtype == object or isinstance(dtype, pd.StringDtype):
+        try:
+            # Joining all-string columns is several times faster than hashing per value
+            return hashlib.sha1("\x1f".join(series.to_numpy(dtype=object)).encode()).hexdigest()
+        except TypeError:
+            pass
+    hashed = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    return hashlib.sha1(hashed.tobytes() + str(dtype).encode()).hexdigest()
+
+
+def frame_hash(df, columns=None, index=False):
+    """Stable hash of DataFrame columns (all by default), their names and
+    optionally the index."""
+    columns = list(df.columns) if columns is None else list(columns)
+    digest = hashlib.sha1(repr(columns).encode())
+    for column in columns:
+        digest.update(column_hash(df[column]).encode())
+    if index:
+        digest.update(column_hash(df.index.to_series()).encode())
+    return digest.hexdigest()
+
+
+class ContentCache:
+    """Computed results under caller-built keys, least recently used out.
+
+    ``lookup(key, compute)`` returns the stored result for ``key`` or calls
+    ``compute()`` and stores it. At most ``max_entries`` results are kept;
+    ``hits`` and ``misses`` count lookups.
+    """
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, key, compute):
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        result = compute()
+        self._entries[key] = result
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
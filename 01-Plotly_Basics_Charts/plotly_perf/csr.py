@@ -0,0 +1,37 @@
+"""
+Grouped Positions in CSR Layout
+===============================
+
+Trees and dependency graphs are stored as one array of parent (or
+predecessor) positions. Walking them level by level needs the reverse
+direction, every position grouped under its parent, which is the
+compressed sparse row layout: the positions under group ``g`` are
+``order[offsets[g]:offsets[g + 1]]``. ``csr_index`` builds it with one
+stable sort and ``csr_gather`` collects several groups at once without a
+Python loop.
+"""
+
+import numpy as np
+
+
+def csr_index(groups, n_groups):
+    """``(offsets, order)`` grouping positions by ``groups``.
+
+    ``groups[i]`` is the group of position ``i`` (e.g. its parent); negative
+    entries belong to no group and are left out. Positions keep their
+    original order within a group.
+    """
+    groups = np.asarray(groups)
+    grouped = np.flatnonzero(groups >= 0)
+    counts = np.bincount(groups[grouped], minlength=n_groups)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return offsets, grouped[np.argsort(groups[grouped], kind="stable")]
+
+
+def csr_gather(selected, offsets, order):
+    """Positions in all of the ``selected`` groups, group by group."""
+    starts = offsets[selected]
+    counts = offsets[selected + 1] - starts
+    # Concatenate the ranges [start, start + count) without a Python loop
+    shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return order[shifts + np.arange(counts.sum())]
@@ -0,0 +1,34 @@
+"""
+Pieces Common to Hierarchical Traces
+====================================
+
+The sunburst engine and the file system icicle both hand node arrays to
+``go.Sunburst``/``go.Treemap``/``go.Icicle`` and both cut large trees down
+to the biggest children of every node. The trace lookup and the sibling
+ranking behind that cut live here.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+TRACE_TYPES = {
+    "sunburst": go.Sunburst,
+    "treemap": go.Treemap,
+    "icicle": go.Icicle,
+}
+
+
+def sibling_rank(parent, values):
+    """Rank of every node among its siblings, 0 for the largest ``values``.
+
+    ``parent`` holds parent positions (-1 for roots, which rank among each
+    other). One lexsort over all nodes, whatever the shape of the tree.
+    """
+    n_nodes = len(parent)
+    order = np.lexsort((-np.asarray(values), parent))
+    sorted_parents = parent[order]
+    group_start = np.flatnonzero(np.r_[True, sorted_parents[1:] != sorted_parents[:-1]])
+    group_sizes = np.diff(np.r_[group_start, n_nodes])
+    rank = np.empty(n_nodes, dtype=np.int64)
+    rank[order] = np.arange(n_nodes) - np.repeat(group_start, group_sizes)
+    return rank